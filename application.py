@@ -0,0 +1,54 @@
+import tkinter as tk
+import weakref
+
+# Bind tag put on the root of each application, its <Destroy> drops the objects kept for the application
+TAG = 'MtkApplication'
+
+# Objects kept for each application, root: {class: instance}
+_applications = weakref.WeakKeyDictionary()
+
+def _forget(ref):
+    """Function to drop the objects of a destroyed application"""
+    root = ref()
+    if root is not None:
+        _applications.pop(root, None)
+
+class PerApplication:
+    """Base of the objects kept once per application, like the pool of tooltip windows or the event router,
+    the one of a class is made by of on first use
+
+    Only a weak reference to the root is kept and the objects are dropped once the root is destroyed,
+    so an application can be collected after it is gone and the next root made gets new ones
+    """
+
+    def __init__(self, master: tk.Misc):
+        root = master._root()
+        self.__root = weakref.ref(root)
+        instances = _applications.get(root)
+        if instances is None:
+            instances = _applications[root] = {}
+            ref = weakref.ref(root)
+            command = root.register(lambda: _forget(ref))
+            root.bindtags((root._w, TAG) + tuple(tag for tag in root.bindtags()[1:] if tag != TAG))
+            root.tk.call('bind', TAG, '<Destroy>', command)
+
+        # Register as the one of its class for the application
+        instances[type(self)] = self
+
+    @property
+    def master(self):
+        """Root of the application, None once it is collected"""
+        return self.__root()
+
+    @classmethod
+    def of(cls, widget):
+        """Function to get the object of the widget's application"""
+        instance = _applications.get(widget._root(), {}).get(cls)
+        if instance is None:
+            instance = cls(widget)
+        return instance
+
+    @classmethod
+    def instances(cls):
+        """Function to get the objects of the class of every application alive"""
+        return [instances[cls] for instances in list(_applications.values()) if cls in instances]
@@ -0,0 +1,325 @@
+import tkinter as tk
+import argparse
+import gc
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import time
+import weakref
+
+from faketk import FakeTk
+from mbuttons import MButton, MButtonGrid, batch
+from placeholders import PlaceholderEntry
+from roundtools import Animator, Placer, RoundedToolTip, TextResolver, ToolTip, ToolTipPool, live_tooltips
+from router import EventRouter
+
+def _rss():
+    """Function to get the resident memory of the process in KiB"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except OSError:  # Peak instead of current outside of linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def _pump(root, until, timeout=5.0):
+    """Function to run the event loop until the until() check passes, returns the time it took or None on timeout"""
+    start = time.perf_counter()
+    while not until():
+        root.update()
+        if time.perf_counter() - start > timeout:
+            return None
+    return time.perf_counter() - start
+
+def _alpha(root):
+    """Function to read back the highest opacity of the tooltip windows"""
+    windows = [w for w in root.winfo_children() if isinstance(w, tk.Toplevel)]
+    return max((float(w.attributes('-alpha')) for w in windows), default=0.0)
+
+def _hover(root, widget):
+    """Function to move the pointer over the widget and send it <Enter>"""
+    root.update()
+    x = widget.winfo_rootx() - root.winfo_rootx() + widget.winfo_width()//2
+    y = widget.winfo_rooty() - root.winfo_rooty() + widget.winfo_height()//2
+    root.event_generate('<Motion>', warp=True, x=x, y=y)
+    widget.event_generate('<Enter>')
+
+def _leave(root, widget):
+    """Function to send <Leave> to the widget and wait for the tooltip to go"""
+    widget.event_generate('<Leave>')
+    _pump(root, lambda: _alpha(root) <= 0)
+
+def bench_construction(root, counts):
+    """Construction time and resident memory of every widget for each instance count"""
+    makers = {  # Tooltips get their target widget made beforehand, out of the measurement
+        'MButton': lambda parent, target, i: MButton(parent, text=f'button {i}', hovfg='#fbc531', hovbg='#192a56'),
+        'PlaceholderEntry': lambda parent, target, i: PlaceholderEntry(parent, placeholder=f'field {i}'),
+        'ToolTip': lambda parent, target, i: ToolTip(target, text=f'tooltip {i}'),
+        'RoundedToolTip': lambda parent, target, i: RoundedToolTip(target, text=f'tooltip {i}'),
+    }
+    results = []
+    for kind,make in makers.items():
+        for count in counts:
+            parent = tk.Frame(root)
+            targets = [tk.Label(parent) if kind.endswith('ToolTip') else None for _ in range(count)]
+            gc.collect()
+            rss = _rss()
+            start = time.perf_counter()
+            keep = [make(parent, target, i) for i,target in enumerate(targets)]
+            root.update_idletasks()
+            seconds = time.perf_counter() - start
+            results.append({'kind': kind, 'count': count, 'seconds': seconds,
+                            'per_instance_us': seconds/count*1e6, 'rss_delta_kib': _rss() - rss})
+            del keep
+            parent.destroy()
+    return results
+
+def bench_grid(root, counts):
+    """Time to build and show a MButtonGrid against the same number of MButton widgets, made one by one or in a batch"""
+    results = []
+    for count in counts:
+        for kind in ('MButton', 'MButton batch', 'MButtonGrid'):
+            parent = tk.Frame(root)
+            parent.pack()
+            start = time.perf_counter()
+            if kind.startswith('MButton '):
+                with batch():
+                    for i in range(count):
+                        MButton(parent, text=str(i), hovfg='#fbc531', hovbg='#192a56').grid(row=i//20, column=i%20)
+            elif kind == 'MButton':
+                for i in range(count):
+                    MButton(parent, text=str(i), hovfg='#fbc531', hovbg='#192a56').grid(row=i//20, column=i%20)
+            else:
+                MButtonGrid(parent, [str(i) for i in range(count)], columns=20, hovfg='#fbc531', hovbg='#192a56').pack()
+            root.update()
+            seconds = time.perf_counter() - start
+            parent.destroy()
+            results.append({'kind': kind, 'count': count, 'seconds': seconds})
+    return results
+
+def bench_hover(root, delays, runs):
+    """Latency from <Enter> to a fully visible RoundedToolTip, against its delaytime"""
+    results = []
+    for delay in delays:
+        button = tk.Button(root, text=f'hover {delay}')
+        button.pack()
+        RoundedToolTip(button, text='hover latency', delaytime=delay, fadein='disabled', fadeout='disabled')
+        latencies = []
+        for _ in range(runs):
+            _hover(root, button)
+            latency = _pump(root, lambda: _alpha(root) >= 1, timeout=delay/1000 + 5)
+            if latency is not None:
+                latencies.append(latency*1000)
+            _leave(root, button)
+        button.destroy()
+        results.append({'delaytime_ms': delay, 'runs': len(latencies),
+                        'mean_ms': statistics.fmean(latencies) if latencies else None,
+                        'error_ms': statistics.fmean(latencies) - delay if latencies else None,
+                        'stdev_ms': statistics.pstdev(latencies) if latencies else None})
+    return results
+
+def bench_fade(root, fadetime, runs):
+    """Duration and jitter of a RoundedToolTip fadein against its fadetime"""
+    button = tk.Button(root, text='fade')
+    button.pack()
+    RoundedToolTip(button, text='fade jitter', delayed=False, fadetime=fadetime, fadeout='disabled')
+    durations = []
+    for _ in range(runs):
+        _hover(root, button)
+        duration = _pump(root, lambda: _alpha(root) >= 1)
+        if duration is not None:
+            durations.append(duration*1000)
+        _leave(root, button)
+    button.destroy()
+    return {'fadetime_ms': fadetime, 'runs': len(durations),
+            'mean_ms': statistics.fmean(durations) if durations else None,
+            'jitter_ms': statistics.pstdev(durations) if durations else None}
+
+def bench_keystroke(root, sizes, keys):
+    """Cost of one keystroke in a PlaceholderEntry holding buffers of different sizes"""
+    results = []
+    for size in sizes:
+        entry = PlaceholderEntry(root, placeholder='type here')
+        entry.pack()
+        entry.insert(0, 'x'*size)
+        entry.focus_force()
+        root.update()
+        start = time.perf_counter()
+        for _ in range(keys):
+            entry.event_generate('<KeyPress>', keysym='a')
+            entry.event_generate('<KeyRelease>', keysym='a')
+        root.update_idletasks()
+        seconds = time.perf_counter() - start
+        entry.destroy()
+        results.append({'buffer': size, 'keys': keys, 'per_key_us': seconds/keys*1e6})
+    return results
+
+def bench_config_text(root, calls):
+    """Throughput of RoundedToolTip.config_text while hidden and while shown, in the default and live modes"""
+    results = {}
+    for live in (False, True):
+        button = tk.Button(root, text='config_text')
+        button.pack()
+        tooltip = RoundedToolTip(button, text='value 0', delayed=False, fadein='disabled', fadeout='disabled', live=live)
+        for shown in (False, True):
+            if shown:
+                _hover(root, button)
+                _pump(root, lambda: _alpha(root) >= 1)
+            start = time.perf_counter()
+            for i in range(calls):
+                tooltip.config_text(f'value {i}')
+            root.update()  # Includes the coalesced live redraw
+            seconds = time.perf_counter() - start
+            results[f"{'live' if live else 'default'}_{'shown' if shown else 'hidden'}"] = {'calls': calls, 'per_second': calls/seconds}
+        _leave(root, button)
+        button.destroy()
+    return results
+
+def bench_lifecycle(root, cycles):
+    """Leak check, memory and live tooltips across create/destroy cycles of a panel with tooltips and a button"""
+    samples = []
+    for i in range(cycles):
+        panel = tk.Frame(root)
+        label = tk.Label(panel, text='panel')
+        RoundedToolTip(label, text='rounded')
+        ToolTip(label, text='plain')
+        MButton(panel, text='button')
+        panel.destroy()
+
+        if i % max(cycles//10, 1) == 0:
+            gc.collect()
+            samples.append(_rss())
+    gc.collect()
+    samples.append(_rss())
+
+    # Growth after the first tenth, once caches and pools are warm
+    return {'cycles': cycles, 'rss_kib': samples, 'growth_kib': samples[-1] - samples[min(1, len(samples) - 1)],
+            'live_tooltips': len(live_tooltips())}
+
+def _panel(root):
+    """Function to show and hide the tooltips of a panel made on root, returns the panel"""
+    panel = tk.Frame(root)
+    panel.pack()
+    label = tk.Label(panel, text='panel')
+    label.pack()
+    RoundedToolTip(label, text='rounded', delaytime=100)
+    ToolTip(label, text='plain')
+    MButton(panel, text='button').pack()
+    root.hover(label)
+    root.advance(500)
+    root.leave(label)
+    root.advance(500)
+    return panel
+
+def check_lifecycle(cycles, roots=5):
+    """Headless leak check on FakeTk, raises AssertionError on a leak
+
+    Panels with tooltips are shown, hovered and destroyed on one root: no tooltip may outlive its panel and
+    the registries of the application may not grow with the cycles. Then whole roots are made and destroyed:
+    they have to be collected along with everything kept for them
+    """
+    root = FakeTk()
+    registries = {'router': EventRouter, 'pool': ToolTipPool, 'placer': Placer, 'animator': Animator, 'resolver': TextResolver}
+    samples = []
+    try:
+        for i in range(cycles):
+            _panel(root).destroy()
+
+            if i % max(cycles//10, 1) == 0:
+                gc.collect()
+                samples.append({name: len(registry.of(root)) for name,registry in registries.items()})
+        gc.collect()
+        samples.append({name: len(registry.of(root)) for name,registry in registries.items()})
+    finally:
+        root.destroy()
+
+    # Sizes once caches and pools are warm, against the last ones
+    warm = samples[min(1, len(samples) - 1)]
+    grown = {name: (warm[name], samples[-1][name]) for name in registries if samples[-1][name] > warm[name]}
+    assert not live_tooltips(), f'{len(live_tooltips())} tooltips outlived their widget'
+    assert not grown, f'registries grew across {cycles} cycles: {grown}'
+
+    # Applications made and destroyed one after another
+    refs = []
+    for _ in range(roots):
+        root = FakeTk()
+        _panel(root)
+        root.destroy()
+        refs.append(weakref.ref(root))
+    del root
+    gc.collect()
+    alive = sum(ref() is not None for ref in refs)
+    kept = {name: len(registry.instances()) for name,registry in registries.items() if registry.instances()}
+    assert not alive, f'{alive} of {roots} destroyed roots were not collected'
+    assert not kept, f'objects kept for destroyed roots: {kept}'
+    return {'cycles': cycles, 'sizes': samples[-1], 'roots': roots}
+
+def _xvfb(display):
+    """Function to start a virtual display when none is set, returns the process to stop afterwards"""
+    if os.environ.get('DISPLAY') and display is None:
+        return None
+    display = display or ':99'
+    os.environ['DISPLAY'] = display
+    if shutil.which('Xvfb') is None:
+        return None  # Expect the display to exist already
+    xvfb = subprocess.Popen(['Xvfb', display, '-screen', '0', '1280x1024x24'],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    return xvfb
+
+def _revision():
+    """Function to get the git revision of the benchmarked code"""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+def run(counts=(1, 100, 10000), delays=(0, 200, 1000), runs=10, sizes=(0, 1000, 100000), keys=200, calls=2000, cycles=100000):
+    """Function to run every benchmark and return the results"""
+    root = tk.Tk()
+    try:
+        return {
+            'meta': {'revision': _revision(), 'python': platform.python_version(), 'tk': root.tk.call('info', 'patchlevel'),
+                     'platform': platform.platform(), 'time': time.strftime('%Y-%m-%dT%H:%M:%S')},
+            'construction': bench_construction(root, counts),
+            'grid': bench_grid(root, counts),
+            'hover': bench_hover(root, delays, runs),
+            'fade': bench_fade(root, 200, runs),
+            'keystroke': bench_keystroke(root, sizes, keys),
+            'config_text': bench_config_text(root, calls),
+            'lifecycle': bench_lifecycle(root, cycles),
+        }
+    finally:
+        root.destroy()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Headless benchmarks of the mtk widgets, written as JSON')
+    parser.add_argument('--out', default='bench_output.json', help='file to write the results to, - for stdout')
+    parser.add_argument('--display', help='X display to use, Xvfb is started on it(default :99 when DISPLAY is unset)')
+    parser.add_argument('--counts', type=int, nargs='+', default=[1, 100, 10000], help='instance counts to construct')
+    parser.add_argument('--runs', type=int, default=10, help='hovers per latency and fade measurement')
+    parser.add_argument('--cycles', type=int, default=100000, help='create/destroy cycles of the leak check')
+    parser.add_argument('--check', action='store_true', help='only run the leak check headless on FakeTk, fails on leaks')
+    args = parser.parse_args()
+
+    if args.check:  # No display needed
+        print(json.dumps(check_lifecycle(args.cycles), indent=2))
+        raise SystemExit
+
+    xvfb = _xvfb(args.display)
+    try:
+        results = run(counts=args.counts, runs=args.runs, cycles=args.cycles)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    data = json.dumps(results, indent=2)
+    if args.out == '-':
+        print(data)
+    else:
+        with open(args.out, 'w') as f:
+            f.write(data)
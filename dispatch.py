@@ -0,0 +1,164 @@
+import tkinter as tk
+import collections
+import sys
+import threading
+import time
+
+import instruments
+from application import PerApplication
+
+class Dispatcher(PerApplication):
+    """Queue of updates posted from any thread and applied on the Tk thread, a bounded batch per frame
+
+    An update posted for a target and property that already has one pending replaces it, so only the
+    latest one is applied, in the place of the first one. Make the dispatcher on the Tk thread(for example
+    with Dispatcher.of(root)), then post to it from anywhere
+
+    Keyword Arguments:
+        batch    -- Most updates applied in a frame(default-500), the others wait for the next frames
+
+        interval -- Time between frames in ms while updates are coming(default-16)
+
+        idle     -- Time between polls in ms while nothing is queued(default-100)
+
+        maxsize  -- Most updates pending at once(default-10000), past it post waits or refuses new ones
+    """
+
+    def __init__(self, master: tk.Misc, batch: int=500, interval: int=16, idle: int=100, maxsize: int=10000):
+        super().__init__(master)
+        self.batch = batch
+        self.interval = interval
+        self.idle = idle
+        self.maxsize = maxsize
+        self.__keys = collections.deque()  # Keys of the pending updates, first posted first
+        self.__pending = {}  # (target, property): (func, args, time first posted)
+        self.__lock = threading.Lock()
+        self.__space = threading.Condition(self.__lock)  # Notified when a batch makes room
+        self.__counts = collections.Counter()
+        self.__maxdepth = 0
+        self.__lag = 0.0  # Age of the oldest update of the last batch in ms
+        self.__took = 0.0  # Time the last batch took in ms
+        self.__job = self.master.after(idle, self.__drain)
+
+    def __len__(self):
+        return len(self.__pending)
+
+    @property
+    def depth(self):
+        """Number of updates waiting to be applied"""
+        return len(self.__pending)
+
+    @property
+    def full(self):
+        """Whether new updates are held back, posters can slow down while it is set"""
+        return len(self.__pending) >= self.maxsize
+
+    def post(self, target, prop, func, *args, block: bool=False, timeout: float=None):
+        """Function to apply func(*args) on the Tk thread, replacing the pending update of target and prop if any,
+        safe from any thread
+
+        Returns False if the queue stayed full, after waiting up to timeout seconds when block is set
+        """
+        key = (target, prop)
+        with self.__space:
+            entry = self.__pending.get(key)
+            if entry is not None:  # Collapsed into the pending one
+                self.__pending[key] = (func, args, entry[2])
+                self.__counts['posted'] += 1
+                self.__counts['collapsed'] += 1
+                return True
+
+            if len(self.__pending) >= self.maxsize:
+                if not block or not self.__space.wait_for(lambda: len(self.__pending) < self.maxsize, timeout):
+                    self.__counts['dropped'] += 1
+                    return False
+
+            self.__pending[key] = (func, args, instruments.now())
+            self.__keys.append(key)
+            self.__counts['posted'] += 1
+            self.__maxdepth = max(self.__maxdepth, len(self.__pending))
+            return True
+
+    def configure(self, widget, **options):
+        """Function to configure options of the widget on the Tk thread, each option is collapsed on its own"""
+        for option,value in options.items():
+            self.post(widget, option, widget.configure, {option: value})
+
+    def __take(self, limit):
+        """Function to take up to limit pending updates, oldest first"""
+        batch = []
+        with self.__space:
+            while self.__keys and len(batch) < limit:
+                entry = self.__pending.pop(self.__keys.popleft(), None)
+                if entry is not None:
+                    batch.append(entry)
+            if batch:
+                self.__space.notify_all()
+        return batch
+
+    def __apply(self, batch):
+        start = time.perf_counter()
+        for func,args,_ in batch:
+            try:
+                func(*args)
+            except Exception:
+                self.master.report_callback_exception(*sys.exc_info())
+        with self.__lock:
+            self.__counts['applied'] += len(batch)
+            self.__counts['batches'] += 1
+            self.__lag = (instruments.now() - batch[0][2])*1000
+            self.__took = (time.perf_counter() - start)*1000
+
+    @instruments.handler('dispatch')
+    def __drain(self):
+        """Function to apply a batch of updates, then wait for the next frame"""
+        batch = self.__take(self.batch)
+        if batch:
+            self.__apply(batch)
+        self.__job = self.master.after(self.interval if batch or self.__keys else self.idle, self.__drain)
+
+    def flush(self):
+        """Function to apply every pending update now, from the Tk thread"""
+        batch = self.__take(len(self.__keys))
+        if batch:
+            self.__apply(batch)
+
+    def stop(self):
+        """Function to stop applying updates, the pending ones are kept"""
+        if self.__job is not None:
+            self.master.after_cancel(self.__job)
+            self.__job = None
+
+    def stats(self):
+        """Function to read the queue metrics
+
+        Returns a dict with:
+            depth      -- Updates pending now
+            max_depth  -- Most updates pending at once so far
+            full       -- Whether posts are held back
+            posted     -- Updates accepted, collapsed ones included
+            collapsed  -- Updates that replaced a pending one
+            dropped    -- Updates refused while full
+            applied    -- Updates applied
+            batches    -- Frames that applied updates
+            lag_ms     -- Age of the oldest update of the last batch when it was applied
+            batch_ms   -- Time the last batch took
+        """
+        with self.__lock:
+            return {'depth': len(self.__pending), 'max_depth': self.__maxdepth, 'full': len(self.__pending) >= self.maxsize,
+                    **{name: self.__counts[name] for name in ('posted', 'collapsed', 'dropped', 'applied', 'batches')},
+                    'lag_ms': self.__lag, 'batch_ms': self.__took}
+
+if __name__ == '__main__':
+    root = tk.Tk()
+    label = tk.Label(root, text='0')
+    label.pack(padx=20, pady=20)
+    dispatcher = Dispatcher.of(root)
+
+    def work():
+        for i in range(1000000):  # Far more than the screen can show, collapsed into one update per frame
+            dispatcher.configure(label, text=str(i))
+        print(dispatcher.stats())
+
+    threading.Thread(target=work, daemon=True).start()
+    root.mainloop()
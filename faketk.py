@@ -0,0 +1,1089 @@
+import tkinter as tk
+import _tkinter
+import collections
+import contextlib
+import heapq
+import re
+import sys
+import time
+
+import instruments
+
+# Widget commands of the fake and the class each one makes
+_CLASSES = {'button': 'Button', 'label': 'Label', 'frame': 'Frame', 'toplevel': 'Toplevel', 'canvas': 'Canvas',
+            'listbox': 'Listbox', 'entry': 'Entry', 'scrollbar': 'Scrollbar', 'text': 'Text',
+            'ttk::entry': 'TEntry', 'ttk::frame': 'TFrame', 'ttk::button': 'TButton', 'ttk::label': 'TLabel',
+            'ttk::scrollbar': 'TScrollbar'}
+_ALIASES = {'-fg': '-foreground', '-bg': '-background', '-bd': '-borderwidth'}
+_DEFAULTS = {'-foreground': '#000000', '-background': '#d9d9d9', '-borderwidth': 1, '-highlightthickness': 0,
+             '-padx': 1, '-pady': 1, '-text': '', '-width': 0, '-height': 0, '-font': 'TkDefaultFont', '-image': '',
+             '-state': 'normal', '-validate': 'none', '-validatecommand': '', '-command': '', '-scrollregion': ''}
+
+# Options of the canvas items, unique abbreviations are resolved like Tk does
+_ITEM_OPTIONS = ('-activefill', '-anchor', '-angle', '-arrow', '-capstyle', '-dash', '-disabledfill', '-extent', '-fill',
+                 '-font', '-image', '-joinstyle', '-justify', '-outline', '-smooth', '-splinesteps', '-start', '-state',
+                 '-stipple', '-style', '-tags', '-text', '-underline', '-width', '-window')
+
+# Event types and their %T number, with the short names of the binding sequences
+_TYPES = {'KeyPress': 2, 'KeyRelease': 3, 'ButtonPress': 4, 'ButtonRelease': 5, 'Motion': 6, 'Enter': 7, 'Leave': 8,
+          'FocusIn': 9, 'FocusOut': 10, 'Destroy': 17, 'Unmap': 18, 'Map': 19, 'Configure': 22, 'MouseWheel': 38}
+_SHORT = {'Key': 'KeyPress', 'Button': 'ButtonPress'}
+_MODIFIERS = {'Control', 'Shift', 'Alt', 'Meta', 'Lock', 'Mod1', 'B1', 'B2', 'B3', 'Button1', 'Button2', 'Button3',
+              'Double', 'Triple', 'Any'}
+_KEYSYMS = {' ': 'space', '\n': 'Return', '\t': 'Tab', '.': 'period', ',': 'comma', '-': 'minus', '@': 'at'}
+
+# Metrics of the fake font, every character has the same width
+CHAR_WIDTH = 7
+LINESPACE = 15
+
+# Named colors known to winfo rgb, 8 bit values
+_COLORS = {'black': (0, 0, 0), 'white': (255, 255, 255), 'red': (255, 0, 0), 'green': (0, 255, 0), 'blue': (0, 0, 255),
+           'yellow': (255, 255, 0), 'cyan': (0, 255, 255), 'magenta': (255, 0, 255), 'orange': (255, 165, 0),
+           'grey': (190, 190, 190), 'gray': (190, 190, 190), 'lightgrey': (211, 211, 211), 'lightgray': (211, 211, 211),
+           'darkgrey': (169, 169, 169), 'darkgray': (169, 169, 169), 'lightyellow': (255, 255, 224)}
+
+# FakeTk roots alive, the clock of the last one made is the one in use, and the clock to put back after them
+_roots = []
+_restore = None
+
+# Kind of each recorded call, by its first word
+_KINDS = {'after': 'after', 'update': 'update', 'bind': 'bind', 'bindtags': 'bind', 'event': 'event', 'winfo': 'winfo',
+          'wm': 'wm', 'ttk::style': 'style', 'font': 'font', 'image': 'image', 'focus': 'focus', 'destroy': 'destroy',
+          'pack': 'geometry', 'grid': 'geometry', 'place': 'geometry', 'apply': 'apply', 'createcommand': 'command',
+          'deletecommand': 'command', 'callback': 'callback'}
+
+def _parse(sequence):
+    """Function to split an event sequence into (modifiers, type, detail)"""
+    if sequence.startswith('<<'):  # Virtual event
+        return frozenset(),sequence,None
+    modifiers,kind,detail = set(),None,None
+    for part in sequence.strip('<>').split('-'):
+        if kind is None and part in _MODIFIERS:
+            modifiers.add(part)
+        elif kind is None and (part in _TYPES or part in _SHORT):
+            kind = _SHORT.get(part, part)
+        else:
+            detail = part
+    if kind is None:  # <1> or <a>
+        kind = 'ButtonPress' if detail is not None and detail.isdigit() else 'KeyPress'
+    modifiers.discard('Any')
+    return frozenset(modifiers),kind,detail
+
+def _quote(value):
+    """Function to quote a value as a single Tcl word"""
+    value = str(value)
+    if value and re.fullmatch(r'[\w.:#@!?+\-/]+', value):
+        return value
+    if not re.search(r'[{}\\]', value):
+        return '{' + value + '}'
+    return re.sub(r'([\\{}\[\]$"; ])', r'\\\1', value)
+
+def _rgb(color):
+    """Function to get the 16 bit rgb value of a named or #hex color, like winfo rgb"""
+    match = re.fullmatch(r'#((?:[0-9a-fA-F]{3}){1,4})', color)
+    if match is not None:
+        digits = match.group(1)
+        n = len(digits)//3
+        return tuple(int(digits[i*n:(i + 1)*n], 16)*0xffff//(16**n - 1) for i in range(3))
+    rgb = _COLORS.get(color.replace(' ', '').lower())
+    if rgb is None:
+        raise tk.TclError(f'unknown color name "{color}"')
+    return tuple(c*257 for c in rgb)
+
+def _option(name, known):
+    """Function to expand a unique abbreviation of an option, unknown ones are kept as they are"""
+    if name in known:
+        return name
+    matches = [option for option in known if option.startswith(name)]
+    if len(matches) > 1:
+        raise tk.TclError(f'ambiguous option "{name}"')
+    return matches[0] if matches else name
+
+def _kind(args, widgets):
+    """Function to get the kind a recorded call is counted under"""
+    first = str(args[0])
+    if first.startswith('.'):
+        widget = widgets.get(first)
+        if widget is not None and widget.cls == 'Canvas' and len(args) > 1 and str(args[1]) in instruments._CANVAS_OPS:
+            return 'canvas'
+        return 'widget'
+    if first in _CLASSES:
+        return 'create'
+    return _KINDS.get(first, 'other')
+
+class _Widget:
+    """State the fake keeps for a widget"""
+    __slots__ = ('path', 'cls', 'options', 'bindtags', 'mapped', 'geometry', 'attributes', 'wm',
+                 'text', 'cursor', 'items', 'view', 'selection', 'variable', 'syncing')
+
+    def __init__(self, path, cls, options, toplevel):
+        self.path = path
+        self.cls = cls
+        self.options = options
+        self.bindtags = (path, cls, 'all') if cls in ('Toplevel', 'Tk') else (path, cls, toplevel, 'all')
+        self.mapped = cls in ('Toplevel', 'Tk')
+        self.geometry = None  # x, y, width, height set explicitly, relative to the parent(root for toplevels)
+        self.attributes = {'-alpha': 1.0, '-topmost': 0}
+        self.wm = {}
+        self.text = []  # Entry text as a list of characters, listbox items
+        self.cursor = 0
+        self.items = {}  # Canvas item id: [type, coords, options, tags]
+        self.view = [0.0, 0.0]  # Canvas scroll offset
+        self.selection = set()
+        self.variable = ''  # Linked -textvariable of an entry
+        self.syncing = False  # Set while the entry writes its variable
+
+    def option(self, name):
+        name = _ALIASES.get(name, name)
+        return self.options.get(name, _DEFAULTS.get(name, ''))
+
+class Recording:
+    """Calls made from python to the fake interpreter during a FakeTk.recording block"""
+
+    def __init__(self, widgets):
+        self.calls = []  # (kind, args)
+        self.__widgets = widgets
+
+    def add(self, args):
+        self.calls.append((_kind(args, self.__widgets), args))
+
+    def counts(self):
+        """Function to count the calls, 'tcl' is every call from python, 'callback' every call back into python
+        and the others are per kind"""
+        counts = collections.Counter(kind for kind,_ in self.calls)
+        counts['tcl'] = len(self.calls) - counts['callback']
+        return counts
+
+    def count(self, kind='tcl'):
+        return self.counts()[kind]
+
+    def budget(self, **limits):
+        """Function to check the calls against limits per kind(tcl for all of them), raises AssertionError
+        naming every kind over its limit"""
+        counts = self.counts()
+        over = {kind: (counts[kind], limit) for kind,limit in limits.items() if counts[kind] > limit}
+        if over:
+            lines = [f'{kind}: {count} calls, budget {limit}' for kind,(count,limit) in over.items()]
+            for kind in over:
+                lines.extend(f'    {args}' for k,args in self.calls if k == kind or (kind == 'tcl' and k != 'callback'))
+            raise AssertionError('Tcl call budget exceeded\n' + '\n'.join(lines))
+
+class _RecordingApp:
+    """Tkapp of a FakeTk, records the calls coming from python before passing them to the interpreter"""
+
+    def __init__(self, tkapp, root):
+        self._tkapp = tkapp
+        self._root = root
+
+    def __getattr__(self, name):
+        return getattr(self._tkapp, name)
+
+    def call(self, *args):
+        if len(args) == 1 and isinstance(args[0], tuple):
+            args = args[0]
+        self._root._record(args)
+        return self._tkapp.call(*args)
+
+    def eval(self, script):
+        self._root._record(('eval', script))
+        return self._tkapp.eval(script)
+
+    def createcommand(self, name, func):
+        self._root._record(('createcommand', name))
+        root = self._root
+
+        def callback(*args):  # Counted as a round trip coming back from Tcl
+            root._record(('callback', name) + args)
+            return func(*args)
+        return self._tkapp.createcommand(name, callback)
+
+    def deletecommand(self, name):
+        self._root._record(('deletecommand', name))
+        return self._tkapp.deletecommand(name)
+
+class FakeTk(tk.Tk):
+    """Stand-in for tk.Tk running the widgets without a display, the Tk commands they use are answered in python
+    on top of a plain Tcl interpreter, time only moves on advance and every call from python is recorded
+
+    Made from it, MButton, PlaceholderEntry and the tooltips work as usual, what is covered of Tk:
+        widgets   -- button, label, frame, toplevel, canvas, listbox, entry, scrollbar and their ttk versions,
+                     configure/cget, canvas items, entry text with validation and -textvariable, listbox items
+        events    -- bind, bindtags and event generate, scripts run with their % fields substituted
+        timers    -- after, after idle and update on a virtual clock, also given to the widgets by instruments.now
+        windows   -- winfo, wm attributes/geometry, pack/grid/place(mapping only, there is no layout), focus
+        resources -- ttk::style, font(CHAR_WIDTH wide characters, LINESPACE high lines), winfo rgb and
+                     photo images(sizes only, put is accepted without keeping the pixels)
+
+    Geometry comes from the requested size of each widget unless set with set_geometry
+
+    Keyword Arguments:
+        screen   -- Size of the screen(default-(1920, 1080))
+
+        geometry -- Root window x, y, width and height(default-(0, 0, 400, 300))
+    """
+
+    def __init__(self, screen=(1920, 1080), geometry=(0, 0, 400, 300)):
+        self.master = None
+        self.children = {}
+        self._tkloaded = True
+        self._tclCommands = []
+        self.tk = None
+        tkapp = _tkinter.create(None, 'faketk', 'FakeTk', False, tk.wantobjects, False, False, None)
+        self.__tkapp = tkapp
+        self.tk = _RecordingApp(tkapp, self)
+
+        self.screen = screen
+        self.pointer = (-1, -1)
+        self.now = 0.0  # Virtual time in ms
+        self.errors = []  # Exceptions raised by callbacks
+        self.__counts = collections.Counter()  # Every call made so far, per kind
+        self.__recordings = []
+        self.__widgets = {'.': _Widget('.', 'Tk', {}, '.')}
+        self.__widgets['.'].geometry = geometry
+        self.__bindings = collections.defaultdict(dict)  # Tag: {sequence: script}
+        self.__parsed = {}  # Sequence: (modifiers, type, detail)
+        self.__timers = []  # Heap of (due, serial, id)
+        self.__scripts = {}  # Timer id: script
+        self.__idle = collections.deque()  # (id, script)
+        self.__ids = 0
+        self.__serial = 0
+        self.__focus = ''
+        self.__styles = collections.defaultdict(dict)
+        self.__fonts = {}
+        self.__images = {}
+
+        # Tk commands, answered in python
+        tkapp.call('namespace', 'eval', 'ttk', '')
+        tkapp.call('namespace', 'eval', 'faketk', '')
+        commands = {'after': self.__after, 'update': self.__update, 'bind': self.__bind, 'bindtags': self.__bindtags,
+                    'event': self.__event, 'winfo': self.__winfo, 'wm': self.__wm, 'focus': self.__focus_command,
+                    'destroy': self.__destroy, 'pack': self.__manage, 'grid': self.__manage, 'place': self.__manage,
+                    'tk': self.__tk, 'font': self.__font, 'image': self.__image, 'ttk::style': self.__style,
+                    'raise': self.__nothing, 'lower': self.__nothing, 'grab': self.__nothing, 'option': self.__nothing,
+                    'clipboard': self.__nothing, 'selection': self.__nothing, 'tk_focusNext': self.__nothing}
+        self.__commands = [*commands, *_CLASSES, '.', 'faketk::textvariable']
+        for name,func in commands.items():
+            tkapp.createcommand(name, func)
+        for name,cls in _CLASSES.items():
+            tkapp.createcommand(name, lambda path, *options, cls=cls: self.__create(cls, path, options))
+        tkapp.createcommand('.', lambda *args: self.__widget('.', *args))
+        tkapp.createcommand('faketk::textvariable', self.__variable_written)
+
+        # Widgets measure delays and fades on the virtual clock, the one of the last FakeTk alive
+        global _restore
+        self.__clock = lambda: self.now/1000
+        previous = instruments.set_clock(self.__clock)
+        if not _roots:
+            _restore = previous
+        _roots.append(self)
+        if tk._support_default_root and tk._default_root is None:
+            tk._default_root = self
+        self.protocol('WM_DELETE_WINDOW', self.destroy)
+
+    def destroy(self):
+        tk.Tk.destroy(self)
+        if self in _roots:
+            # The python commands answering Tk hold the root from inside the interpreter, out of reach of gc
+            for name in tuple(self.__commands) + tuple(self.__images):
+                self.__tkapp.deletecommand(name)
+            self.__images.clear()
+            _roots.remove(self)
+            instruments.set_clock(_roots[-1].__clock if _roots else _restore)
+
+    def report_callback_exception(self, exc, val, tb):
+        self.errors.append(val)
+
+    def mainloop(self, n=0):
+        """Function to run the timers until none are left, pollers running forever never let it return"""
+        while self.__timers or self.__idle:
+            self.advance(max(self.__timers[0][0] - self.now, 0) if self.__timers else 0)
+
+    # Recording
+
+    def _record(self, args):
+        kind = _kind(args, self.__widgets)
+        self.__counts[kind] += 1
+        if kind != 'callback':
+            self.__counts['tcl'] += 1
+        for recording in self.__recordings:
+            recording.calls.append((kind, args))
+
+    @property
+    def counts(self):
+        """Every call made so far, counted like Recording.counts"""
+        return collections.Counter(self.__counts)
+
+    @contextlib.contextmanager
+    def recording(self):
+        """Context manager recording the calls made from python in its block"""
+        recording = Recording(self.__widgets)
+        self.__recordings.append(recording)
+        try:
+            yield recording
+        finally:
+            self.__recordings.remove(recording)
+
+    # Scenarios
+
+    def __check(self):
+        if self.errors:
+            raise self.errors.pop(0)
+
+    def advance(self, ms=0):
+        """Function to move the virtual clock by ms, running the timers and idle callbacks due meanwhile"""
+        target = self.now + ms
+        self.__run_idle()
+        while self.__timers and self.__timers[0][0] <= target:
+            due,_,id = heapq.heappop(self.__timers)
+            script = self.__scripts.pop(id, None)
+            if script is None:  # Cancelled
+                continue
+            self.now = max(self.now, due)
+            self.__run(script)
+            self.__run_idle()
+        self.now = target
+        self.__check()
+
+    def set_geometry(self, widget, x, y, width, height):
+        """Function to give the widget a position(in its parent, on the screen for windows) and size"""
+        w = self.__widgets[str(widget)]
+        w.geometry = (x, y, width, height)
+        self.__fire(w.path, '<Configure>', {'w': width, 'h': height})
+        self.__check()
+
+    def set_pointer(self, x, y):
+        self.pointer = (x, y)
+
+    def hover(self, widget, x=None, y=None):
+        """Function to move the pointer over the widget(its center unless x, y are given) and send <Enter> and <Motion>"""
+        rootx,rooty,width,height = self.__rect(str(widget))
+        x = width//2 if x is None else x
+        y = height//2 if y is None else y
+        self.pointer = (rootx + x, rooty + y)
+        self.__fire(str(widget), '<Enter>', {'x': x, 'y': y})
+        self.__fire(str(widget), '<Motion>', {'x': x, 'y': y})
+        self.__check()
+
+    def leave(self, widget):
+        """Function to move the pointer away from the widget and send <Leave>"""
+        self.pointer = (-1, -1)
+        self.__fire(str(widget), '<Leave>', {})
+        self.__check()
+
+    def click(self, widget, button=1):
+        """Function to press and release a mouse button over the widget"""
+        for sequence in (f'<ButtonPress-{button}>', f'<ButtonRelease-{button}>'):
+            self.__fire(str(widget), sequence, {'b': button})
+        self.__check()
+
+    def type(self, widget, text):
+        """Function to type text in the entry, each key is pressed, inserted at the cursor then released"""
+        path = str(widget)
+        for char in text:
+            keysym = _KEYSYMS.get(char, char)
+            fields = {'K': keysym, 'A': char}
+            if self.__fire(path, f'<KeyPress-{keysym}>', fields) != 'break' and path in self.__widgets:
+                self.__insert(self.__widgets[path], 'insert', char)
+            self.__fire(path, f'<KeyRelease-{keysym}>', fields)
+        self.__check()
+
+    # Events
+
+    def __run(self, script):
+        """Function to evaluate a script, returns the Tcl return code"""
+        code = self.__tkapp.getint(self.__tkapp.call('catch', script, '::faketk::result'))
+        if code == 1:
+            raise tk.TclError(self.__tkapp.call('set', '::faketk::result'))
+        return code
+
+    def __run_idle(self):
+        for _ in range(10000):  # Idle callbacks queueing new ones
+            if not self.__idle:
+                break
+            _,script = self.__idle.popleft()
+            self.__run(script)
+
+    def __substitute(self, script, path, kind, detail, fields):
+        """Function to replace the % fields of a binding script"""
+        rootx,rooty,_,_ = self.__rect(path)
+        x = fields.get('x', self.pointer[0] - rootx)
+        y = fields.get('y', self.pointer[1] - rooty)
+        values = {'#': self.__serial, 'b': detail if kind.startswith('Button') and detail else fields.get('b', '??'),
+                  'f': 0, 'h': fields.get('h', '??'), 'k': '??', 's': 0, 't': int(self.now), 'w': fields.get('w', '??'),
+                  'x': x, 'y': y, 'A': fields.get('A', ''), 'E': 1, 'K': fields.get('K', detail or '??'), 'N': '??',
+                  'W': path, 'T': _TYPES.get(kind, 35), 'X': fields.get('X', rootx + x), 'Y': fields.get('Y', rooty + y),
+                  'D': fields.get('D', '??'), 'd': '??', '%': '%'}
+        return re.sub(r'%(.)', lambda m: _quote(values.get(m.group(1), '??')), script)
+
+    def __fire(self, path, sequence, fields):
+        """Function to run the best matching binding of each bind tag of the widget, returns 'break' if one broke"""
+        widget = self.__widgets.get(path)
+        if widget is None:
+            return None
+        self.__serial += 1
+        modifiers,kind,detail = _parse(sequence)
+        for tag in widget.bindtags:
+            best,rank = None,None
+            for bound,script in self.__bindings.get(tag, {}).items():
+                parsed = self.__parsed.get(bound)
+                if parsed is None:
+                    parsed = self.__parsed[bound] = _parse(bound)
+                bmodifiers,bkind,bdetail = parsed
+                if bkind != kind or (bdetail is not None and bdetail != detail) or not bmodifiers <= modifiers:
+                    continue
+                r = (bdetail is not None, len(bmodifiers))
+                if rank is None or r > rank:
+                    best,rank = script,r
+            if best and self.__run(self.__substitute(best, path, kind, detail, fields)) == 3:  # break
+                return 'break'
+        return None
+
+    # Geometry
+
+    def __parent(self, path):
+        return '.' if path.count('.') == 1 else path.rsplit('.', 1)[0]
+
+    def __toplevel(self, path):
+        while path != '.' and self.__widgets[path].cls != 'Toplevel':
+            path = self.__parent(path)
+        return path
+
+    def __reqsize(self, widget):
+        """Function to get the requested size of a widget, from its options and text"""
+        option = widget.option
+        pad = int(option('-borderwidth')) + int(option('-highlightthickness'))
+        width,height = int(float(option('-width') or 0)),int(float(option('-height') or 0))
+        if widget.cls in ('Button', 'Label', 'TButton', 'TLabel'):
+            lines = str(option('-text')).split('\n')
+            if option('-image') and not option('-compound'):
+                lines = ['']
+            w = CHAR_WIDTH*width if width and not option('-image') else width or CHAR_WIDTH*max(len(l) for l in lines)
+            return w + 2*(pad + int(option('-padx'))),LINESPACE*len(lines) + 2*(pad + int(option('-pady')))
+        if widget.cls in ('Entry', 'TEntry'):
+            return CHAR_WIDTH*(width or 20) + 2*pad,LINESPACE + 2*pad
+        if widget.cls == 'Listbox':
+            return CHAR_WIDTH*(width or 20) + 2*pad,LINESPACE*(height or 10) + 2*pad
+        if widget.cls in ('Canvas', 'Frame', 'TFrame', 'Toplevel'):
+            return (width or 1) + 2*pad,(height or 1) + 2*pad
+        return max(width, 1),max(height, 1)
+
+    def __size(self, widget):
+        if widget.geometry is not None:
+            return widget.geometry[2:]
+        return self.__reqsize(widget)
+
+    def __rect(self, path):
+        """Function to get the root x, y, width and height of a widget"""
+        widget = self.__widgets.get(path)
+        if widget is None:
+            return 0,0,0,0
+        w,h = self.__size(widget)
+        x,y = widget.geometry[:2] if widget.geometry is not None else (0, 0)
+        if widget.cls not in ('Toplevel', 'Tk'):
+            px,py,_,_ = self.__rect(self.__parent(path))
+            x,y = x + px,y + py
+        return x,y,w,h
+
+    def __viewable(self, path):
+        while True:
+            widget = self.__widgets.get(path)
+            if widget is None or not widget.mapped:
+                return False
+            if widget.cls in ('Toplevel', 'Tk'):
+                return True
+            path = self.__parent(path)
+
+    def __map(self, widget, mapped):
+        if widget.mapped != mapped:
+            widget.mapped = mapped
+            self.__fire(widget.path, '<Map>' if mapped else '<Unmap>', {})
+
+    # Tk commands
+
+    def __nothing(self, *args):
+        return ''
+
+    def __next_id(self, prefix):
+        self.__ids += 1
+        return f'{prefix}#{self.__ids}'
+
+    def __after(self, *args):
+        first = args[0]
+        if first == 'cancel':
+            target = ' '.join(args[1:])
+            self.__scripts.pop(target, None)
+            for id,script in list(self.__scripts.items()):
+                if script == target:
+                    del self.__scripts[id]
+            self.__idle = collections.deque((id, s) for id,s in self.__idle if target not in (id, s))
+            return ''
+        if first == 'idle':
+            id = self.__next_id('after')
+            self.__idle.append((id, ' '.join(args[1:])))
+            return id
+        if first == 'info':
+            if len(args) == 1:
+                return tuple(self.__scripts) + tuple(id for id,_ in self.__idle)
+            if args[1] in self.__scripts:
+                return (self.__scripts[args[1]], 'timer')
+            for id,script in self.__idle:
+                if id == args[1]:
+                    return (script, 'idle')
+            raise tk.TclError(f'event "{args[1]}" doesn\'t exist')
+        if len(args) == 1:  # Sleeps
+            self.advance(float(first))
+            return ''
+        id = self.__next_id('after')
+        self.__scripts[id] = ' '.join(args[1:])
+        heapq.heappush(self.__timers, (self.now + float(first), self.__ids, id))
+        return id
+
+    def __update(self, *args):
+        if args and args[0] == 'idletasks':
+            self.__run_idle()
+        else:
+            self.advance(0)
+        return ''
+
+    def __bind(self, tag, sequence=None, script=None):
+        bindings = self.__bindings[tag]
+        if sequence is None:
+            return tuple(bindings)
+        if script is None:
+            return bindings.get(sequence, '')
+        if not script:
+            bindings.pop(sequence, None)
+        elif script.startswith('+'):
+            bindings[sequence] = bindings.get(sequence, '') + '\n' + script[1:]
+        else:
+            bindings[sequence] = script
+        return ''
+
+    def __bindtags(self, path, tags=None):
+        widget = self.__widgets[path]
+        if tags is None:
+            return widget.bindtags
+        widget.bindtags = tuple(self.__tkapp.splitlist(tags)) or widget.bindtags
+        return ''
+
+    def __event(self, subcommand, *args):
+        if subcommand != 'generate':
+            return ''
+        path,sequence = args[0],args[1]
+        options = dict(zip(args[2::2], args[3::2]))
+        fields = {}
+        for option,field in (('-x', 'x'), ('-y', 'y'), ('-rootx', 'X'), ('-rooty', 'Y'), ('-keysym', 'K'),
+                             ('-delta', 'D'), ('-button', 'b'), ('-width', 'w'), ('-height', 'h')):
+            if option in options:
+                fields[field] = options[option] if field == 'K' else int(float(options[option]))
+        if options.get('-warp') in ('1', 'true') and 'x' in fields and 'y' in fields:
+            rootx,rooty,_,_ = self.__rect(path)
+            self.pointer = (rootx + fields['x'], rooty + fields['y'])
+        if 'K' in fields and sequence.startswith('<Key'):
+            sequence = f'{sequence[:-1]}-{fields["K"]}>'
+        self.__fire(path, sequence, fields)
+        return ''
+
+    def __winfo(self, subcommand, *args):
+        if subcommand in ('screenwidth', 'screenheight'):
+            return self.screen[subcommand == 'screenheight']
+        if subcommand in ('pointerx', 'pointery', 'pointerxy'):
+            return {'pointerx': self.pointer[0], 'pointery': self.pointer[1], 'pointerxy': self.pointer}[subcommand]
+        if subcommand == 'containing':
+            coords = [a for a in args if not a.startswith('-')][-2:]
+            x,y = int(float(coords[0])),int(float(coords[1]))
+            found = ''
+            for path in self.__widgets:
+                if self.__viewable(path):
+                    rx,ry,w,h = self.__rect(path)
+                    if rx <= x < rx + w and ry <= y < ry + h and path.count('.') >= found.count('.'):
+                        found = path
+            return found
+        if subcommand == 'rgb':
+            return _rgb(args[-1])
+        if subcommand in ('fpixels', 'pixels'):
+            value = float(str(args[-1]).rstrip('p'))
+            return value if subcommand == 'fpixels' else int(value)
+
+        path = args[0]
+        if subcommand == 'exists':
+            return int(path in self.__widgets)
+        widget = self.__widgets.get(path)
+        if widget is None:
+            raise tk.TclError(f'bad window path name "{path}"')
+        if subcommand == 'children':
+            return tuple(p for p in self.__widgets if p != path and p != '.' and self.__parent(p) == path)
+        if subcommand in ('ismapped', 'viewable'):
+            return int(self.__viewable(path))
+        if subcommand == 'toplevel':
+            return self.__toplevel(path)
+        if subcommand == 'class':
+            return widget.cls
+        if subcommand in ('reqwidth', 'reqheight'):
+            return self.__reqsize(widget)[subcommand == 'reqheight']
+        if subcommand in ('width', 'height'):
+            return self.__size(widget)[subcommand == 'height']
+        if subcommand in ('rootx', 'rooty'):
+            return self.__rect(path)[subcommand == 'rooty']
+        if subcommand in ('x', 'y'):
+            return widget.geometry[subcommand == 'y'] if widget.geometry is not None else 0
+        if subcommand == 'id':
+            return hash(path) & 0xffffff
+        return ''
+
+    def __wm(self, subcommand, path, *args):
+        widget = self.__widgets[path]
+        if subcommand == 'attributes':
+            if not args:
+                return tuple(v for pair in widget.attributes.items() for v in pair)
+            if len(args) == 1:
+                return widget.attributes.get(args[0], '')
+            for option,value in zip(args[::2], args[1::2]):
+                widget.attributes[option] = value
+            return ''
+        if subcommand == 'geometry':
+            x,y,w,h = self.__rect(path)
+            if not args:
+                return f'{w}x{h}+{x}+{y}'
+            match = re.fullmatch(r'(?:(\d+)x(\d+))?(?:([+-]-?\d+)([+-]-?\d+))?', args[0])
+            if match is None:
+                raise tk.TclError(f'bad geometry specifier "{args[0]}"')
+            if match.group(1):
+                w,h = int(match.group(1)),int(match.group(2))
+            if match.group(3):
+                x,y = int(match.group(3)),int(match.group(4))
+            if widget.geometry != (x, y, w, h):
+                widget.geometry = (x, y, w, h)
+                self.__fire(path, '<Configure>', {'w': w, 'h': h})
+            return ''
+        if subcommand == 'withdraw':
+            self.__map(widget, False)
+            return ''
+        if subcommand == 'deiconify':
+            self.__map(widget, True)
+            return ''
+        if subcommand == 'state':
+            return 'normal' if widget.mapped else 'withdrawn'
+        if not args:
+            return widget.wm.get(subcommand, '')
+        widget.wm[subcommand] = args if len(args) > 1 else args[0]
+        return ''
+
+    def __focus_command(self, *args):
+        paths = [a for a in args if not a.startswith('-')]
+        if not paths or '-displayof' in args or '-lastfor' in args:
+            return self.__focus
+        path = paths[0]
+        if path != self.__focus:
+            old,self.__focus = self.__focus,path
+            if old:
+                self.__fire(old, '<FocusOut>', {})
+            self.__fire(path, '<FocusIn>', {})
+        return ''
+
+    def __destroy(self, *paths):
+        for path in paths:
+            doomed = sorted((p for p in self.__widgets if p == path or p.startswith(path if path == '.' else path + '.')),
+                            key=lambda p: -p.count('.'))  # Children first
+            for p in doomed:
+                if p not in self.__widgets:
+                    continue
+                self.__fire(p, '<Destroy>', {})
+                if self.__widgets[p].variable:
+                    self.__link(self.__widgets[p], '')
+                self.__widgets.pop(p, None)
+                self.__bindings.pop(p, None)
+                if p != '.':
+                    self.__tkapp.deletecommand(p)
+                if self.__focus == p:
+                    self.__focus = ''
+        return ''
+
+    def __manage(self, subcommand, *args):
+        if subcommand == 'configure' or subcommand.startswith('.'):
+            for path in [subcommand] + list(args) if subcommand.startswith('.') else args:
+                if str(path).startswith('.') and path in self.__widgets:
+                    self.__map(self.__widgets[path], True)
+        elif subcommand in ('forget', 'remove'):
+            for path in args:
+                if path in self.__widgets:
+                    self.__map(self.__widgets[path], False)
+        return ''
+
+    def __tk(self, subcommand, *args):
+        return {'windowingsystem': 'x11', 'scaling': 1.0}.get(subcommand, '')
+
+    def __font(self, subcommand, *args):
+        if subcommand == 'actual':
+            return ('-family', 'fake', '-size', 10, '-weight', 'normal', '-slant', 'roman', '-underline', 0, '-overstrike', 0)
+        if subcommand in ('create', 'configure'):
+            self.__fonts[args[0]] = args[1:]
+            return args[0]
+        if subcommand == 'delete':
+            for name in args:
+                self.__fonts.pop(name, None)
+            return ''
+        if subcommand == 'names':
+            return tuple(self.__fonts)
+        if subcommand == 'measure':
+            return CHAR_WIDTH*len(args[-1])
+        if subcommand == 'metrics':
+            metrics = {'-ascent': LINESPACE - 3, '-descent': 3, '-linespace': LINESPACE, '-fixed': 1}
+            option = args[-1] if args[-1] in metrics else None
+            return metrics[option] if option else tuple(v for pair in metrics.items() for v in pair)
+        return ''
+
+    def __image(self, subcommand, *args):
+        if subcommand == 'create':
+            options = args[1:]
+            name = options[0] if options and not options[0].startswith('-') else self.__next_id('image')
+            if options and not options[0].startswith('-'):
+                options = options[1:]
+            self.__images[name] = {'-width': 0, '-height': 0, **dict(zip(options[::2], options[1::2]))}
+            self.__tkapp.createcommand(name, lambda *a, name=name: self.__photo(name, *a))
+            return name
+        if subcommand == 'delete':
+            for name in args:
+                if self.__images.pop(name, None) is not None:
+                    self.__tkapp.deletecommand(name)
+            return ''
+        if subcommand in ('width', 'height'):
+            return self.__images[args[0]][f'-{subcommand}']
+        if subcommand == 'names':
+            return tuple(self.__images)
+        if subcommand == 'type':
+            return 'photo'
+        return ''
+
+    def __photo(self, name, subcommand, *args):
+        image = self.__images[name]
+        if subcommand == 'cget':
+            return image.get(args[0], '')
+        if subcommand == 'configure':
+            image.update(zip(args[::2], args[1::2]))
+        elif subcommand in ('width', 'height'):
+            return image[f'-{subcommand}']
+        elif subcommand == 'put':  # Accepted, the pixels are not kept
+            image['puts'] = image.get('puts', 0) + 1
+        return ''
+
+    def __style(self, subcommand, *args):
+        if subcommand in ('configure', 'map'):
+            style = self.__styles[(subcommand, args[0])]
+            if len(args) == 2:
+                return style.get(args[1], '')
+            style.update(zip(args[1::2], args[2::2]))
+            return ''
+        if subcommand == 'lookup':
+            return self.__styles[('configure', args[0])].get(args[1], '')
+        if subcommand == 'theme':
+            return ('default',) if args and args[0] == 'names' else 'default'
+        return ''
+
+    # Widgets
+
+    def __create(self, cls, path, options):
+        options = {_ALIASES.get(k, k): v for k,v in zip(options[::2], options[1::2])}
+        widget = self.__widgets[path] = _Widget(path, cls, options, '')
+        if cls not in ('Toplevel', 'Tk'):
+            widget.bindtags = (path, cls, self.__toplevel(self.__parent(path)), 'all')
+        self.__tkapp.createcommand(path, lambda *args: self.__widget(path, *args))
+        if options.get('-textvariable'):
+            self.__link(widget, options['-textvariable'])
+        return path
+
+    def __link(self, widget, variable):
+        """Function to link an entry to its -textvariable like ttk, the text follows writes to the variable"""
+        if widget.variable:
+            self.__tkapp.call('trace', 'remove', 'variable', widget.variable, 'write', ('faketk::textvariable', widget.path))
+        widget.variable = variable
+        if not variable:
+            return
+        if self.__tkapp.getboolean(self.__tkapp.call('info', 'exists', variable)):
+            widget.text = list(self.__tkapp.globalgetvar(variable))
+        else:
+            self.__tkapp.globalsetvar(variable, ''.join(widget.text))
+        widget.cursor = min(widget.cursor, len(widget.text))
+        self.__tkapp.call('trace', 'add', 'variable', variable, 'write', ('faketk::textvariable', widget.path))
+
+    def __variable_written(self, path, name, element, op):
+        widget = self.__widgets.get(path)
+        if widget is None or widget.syncing:  # Written by the entry itself
+            return
+        widget.text = list(self.__tkapp.globalgetvar(widget.variable))
+        widget.cursor = min(widget.cursor, len(widget.text))
+
+    def __store(self, widget):
+        """Function to write the text of an entry to its variable, a write trace changing the value wins like in ttk"""
+        if not widget.variable:
+            return
+        text = ''.join(widget.text)
+        widget.syncing = True
+        try:
+            self.__tkapp.globalsetvar(widget.variable, text)
+        finally:
+            widget.syncing = False
+        value = self.__tkapp.globalgetvar(widget.variable)
+        if value != text:
+            widget.text = list(value)
+            widget.cursor = min(widget.cursor, len(widget.text))
+
+    def __widget(self, path, subcommand=None, *args):
+        widget = self.__widgets[path]
+        if subcommand == 'configure':
+            if not args:
+                return tuple((k, '', '', _DEFAULTS.get(k, ''), v) for k,v in widget.options.items())
+            if len(args) == 1:
+                name = _ALIASES.get(args[0], args[0])
+                return (name, '', '', _DEFAULTS.get(name, ''), widget.option(name))
+            for name,value in zip(args[::2], args[1::2]):
+                widget.options[_ALIASES.get(name, name)] = value
+                if name == '-textvariable' and widget.cls in ('Entry', 'TEntry'):
+                    self.__link(widget, value)
+            return ''
+        if subcommand == 'cget':
+            return widget.option(args[0])
+        if widget.cls == 'Canvas':
+            return self.__canvas(widget, subcommand, args)
+        if widget.cls in ('Entry', 'TEntry'):
+            return self.__entry(widget, subcommand, args)
+        if widget.cls == 'Listbox':
+            return self.__listbox(widget, subcommand, args)
+        if subcommand == 'invoke' and widget.option('-command'):
+            self.__run(widget.option('-command'))
+        if subcommand == 'instate':
+            return 1
+        return ''
+
+    def __index(self, widget, index):
+        if index == 'end':
+            return len(widget.text)
+        if index == 'insert':
+            return widget.cursor
+        if index.startswith('@') or index.startswith('sel') or index == 'anchor':
+            return 0
+        return max(0, min(int(index), len(widget.text)))
+
+    def __validate(self, widget, action, index, change, new):
+        """Function to run the validatecommand of an entry, returns whether the edit is allowed"""
+        command = widget.option('-validatecommand')
+        if widget.option('-validate') not in ('key', 'all') or not command:
+            return True
+        values = {'d': action, 'i': index, 'S': change, 'P': new, 's': ''.join(widget.text),
+                  'v': widget.option('-validate'), 'V': 'key', 'W': widget.path, '%': '%'}
+        script = re.sub(r'%(.)', lambda m: _quote(values[m.group(1)]) if m.group(1) in values else m.group(0), command)
+        return self.__tkapp.getboolean(self.__tkapp.eval(script))
+
+    def __insert(self, widget, index, text):
+        i = self.__index(widget, index)
+        new = widget.text[:i] + list(text)
+        if text and self.__validate(widget, '1', i, text, ''.join(new + widget.text[i:])):
+            widget.text[i:i] = list(text)
+            if widget.cursor >= i:
+                widget.cursor += len(text)
+            self.__store(widget)
+
+    def __entry(self, widget, subcommand, args):
+        if subcommand == 'get':
+            return ''.join(widget.text)
+        if subcommand == 'insert':
+            self.__insert(widget, args[0], args[1])
+        elif subcommand == 'delete':
+            first = self.__index(widget, args[0])
+            last = self.__index(widget, args[1]) if len(args) > 1 else first + 1
+            change = ''.join(widget.text[first:last])
+            if change and self.__validate(widget, '0', first, change, ''.join(widget.text[:first] + widget.text[last:])):
+                del widget.text[first:last]
+                widget.cursor = first if widget.cursor > first else widget.cursor
+                self.__store(widget)
+        elif subcommand == 'icursor':
+            widget.cursor = self.__index(widget, args[0])
+        elif subcommand == 'index':
+            return self.__index(widget, args[0])
+        elif subcommand == 'instate':
+            return 1
+        return ''
+
+    def __listbox(self, widget, subcommand, args):
+        items = widget.text
+        if subcommand == 'insert':
+            i = len(items) if args[0] == 'end' else int(args[0])
+            items[i:i] = args[1:]
+        elif subcommand == 'delete':
+            first = 0 if args[0] != 'end' and int(args[0]) <= 0 else len(items) if args[0] == 'end' else int(args[0])
+            last = len(items) if len(args) < 2 or args[1] == 'end' else int(args[1]) + 1
+            del items[first:last]
+            widget.selection = {i for i in widget.selection if i < len(items)}
+        elif subcommand == 'size':
+            return len(items)
+        elif subcommand == 'get':
+            return items[int(args[0])] if len(args) == 1 else tuple(items[int(args[0]):])
+        elif subcommand == 'curselection':
+            return tuple(sorted(widget.selection))
+        elif subcommand == 'selection':
+            first = int(args[1]) if args[1] != 'end' else len(items) - 1
+            last = first if len(args) < 3 else (len(items) - 1 if args[2] == 'end' else int(args[2]))
+            if args[0] == 'set':
+                widget.selection.update(range(first, last + 1))
+            elif args[0] == 'clear':
+                widget.selection.difference_update(range(first, last + 1))
+            elif args[0] == 'includes':
+                return int(first in widget.selection)
+        elif subcommand == 'nearest':
+            return 0
+        return ''
+
+    def __find(self, widget, tag):
+        """Function to get the ids of the canvas items matching a tag or id, in display order"""
+        if tag == 'all':
+            return list(widget.items)
+        if tag.isdigit():
+            return [int(tag)] if int(tag) in widget.items else []
+        return [id for id,item in widget.items.items() if tag in item[3]]
+
+    def __coords(self, args):
+        if len(args) == 1:
+            args = self.__tkapp.splitlist(args[0])
+        return [float(a) for a in args]
+
+    def __canvas(self, widget, subcommand, args):
+        items = widget.items
+        if subcommand == 'create':
+            numbers = []
+            rest = list(args[1:])
+            while rest and not str(rest[0]).startswith('-'):
+                numbers.append(rest.pop(0))
+            options = {_option(k, _ITEM_OPTIONS): v for k,v in zip(rest[::2], rest[1::2])}
+            tags = list(self.__tkapp.splitlist(options.pop('-tags', '')))
+            self.__ids += 1
+            items[self.__ids] = [args[0], self.__coords(numbers), options, tags]
+            return self.__ids
+        if subcommand == 'coords':
+            found = self.__find(widget, str(args[0]))
+            if len(args) == 1:
+                return tuple(items[found[0]][1]) if found else ''
+            if found:
+                items[found[0]][1] = self.__coords(args[1:])
+            return ''
+        if subcommand == 'itemconfigure':
+            found = self.__find(widget, str(args[0]))
+            if len(args) == 2:
+                name = _option(args[1], _ITEM_OPTIONS)
+                value = items[found[0]][2].get(name, '') if found else ''
+                return (name, '', '', '', value)
+            for id in found:
+                options = {_option(k, _ITEM_OPTIONS): v for k,v in zip(args[1::2], args[2::2])}
+                if '-tags' in options:
+                    items[id][3] = list(self.__tkapp.splitlist(options.pop('-tags')))
+                items[id][2].update(options)
+            return ''
+        if subcommand == 'itemcget':
+            found = self.__find(widget, str(args[0]))
+            return items[found[0]][2].get(_option(args[1], _ITEM_OPTIONS), '') if found else ''
+        if subcommand == 'delete':
+            for tag in args:
+                for id in self.__find(widget, str(tag)):
+                    del items[id]
+            return ''
+        if subcommand == 'move':
+            for id in self.__find(widget, str(args[0])):
+                coords = items[id][1]
+                items[id][1] = [c + float(args[1 + i % 2]) for i,c in enumerate(coords)]
+            return ''
+        if subcommand == 'bbox':
+            coords = [items[id][1] for tag in args for id in self.__find(widget, str(tag))]
+            xs = [c for cs in coords for c in cs[::2]]
+            ys = [c for cs in coords for c in cs[1::2]]
+            return (int(min(xs)), int(min(ys)), int(max(xs)) + 1, int(max(ys)) + 1) if xs else ''
+        if subcommand == 'find':
+            return tuple(self.__find(widget, 'all' if args[0] == 'all' else str(args[-1])))
+        if subcommand == 'gettags':
+            found = self.__find(widget, str(args[0]))
+            return tuple(items[found[0]][3]) if found else ()
+        if subcommand == 'type':
+            found = self.__find(widget, str(args[0]))
+            return items[found[0]][0] if found else ''
+        if subcommand in ('addtag', 'dtag'):
+            return ''
+        if subcommand in ('canvasx', 'canvasy'):
+            return float(args[0]) + widget.view[subcommand == 'canvasy']
+        if subcommand in ('xview', 'yview'):
+            axis = subcommand == 'yview'
+            region = [float(v) for v in self.__tkapp.splitlist(widget.option('-scrollregion'))] or [0, 0, 0, 0]
+            length = region[2 + axis] - region[axis]
+            if not args:
+                size = self.__size(widget)[axis]
+                return (widget.view[axis]/length, min((widget.view[axis] + size)/length, 1.0)) if length else (0.0, 1.0)
+            if args[0] == 'moveto':
+                widget.view[axis] = float(args[1])*length
+            elif args[0] == 'scroll':
+                step = self.__size(widget)[axis] if args[2].startswith('page') else 10
+                widget.view[axis] = max(widget.view[axis] + int(args[1])*step, 0)
+            return ''
+        return ''
+
+def _scenarios():
+    """Function to replay hover, fade, typing and live updates on a FakeTk, returns their call counts and times"""
+    from mbuttons import MButton
+    from placeholders import PlaceholderEntry
+    from roundtools import RoundedToolTip, ToolTip
+
+    results = {}
+    root = FakeTk()
+    try:
+        def replay(name, setup, scenario):
+            target = setup()
+            start = time.perf_counter()
+            with root.recording() as recording:
+                scenario(target)
+            results[name] = {'calls': dict(recording.counts()), 'ms': (time.perf_counter() - start)*1000}
+
+        def rounded():
+            label = tk.Label(root, text='rounded')
+            label.pack()
+            RoundedToolTip(label, text='Rounded tooltip', delaytime=500)
+            return label
+
+        def plain():
+            label = tk.Label(root, text='plain')
+            label.pack()
+            ToolTip(label, text='Plain tooltip')
+            return label
+
+        def entry():
+            e = PlaceholderEntry(root, placeholder='Type here')
+            e.pack()
+            root.tk.call('focus', str(e))
+            return e
+
+        def button():
+            b = MButton(root, text='button', hovfg='#fbc531', hovbg='#192a56')
+            b.pack()
+            return b
+
+        def live():
+            label = tk.Label(root, text='live')
+            label.pack()
+            tooltip = RoundedToolTip(label, text='0', delayed=False, live=True)
+            root.hover(label)
+            root.advance(250)
+            return tooltip
+
+        def updates(tooltip):
+            for i in range(1000):  # 1kHz for a second
+                tooltip.config_text(str(i))
+                root.advance(1)
+
+        replay('rounded_show_hide', rounded, lambda w: (root.hover(w), root.advance(1000), root.leave(w), root.advance(300)))
+        replay('tooltip_show_hide', plain, lambda w: (root.hover(w), root.advance(10), root.leave(w), root.advance(300)))
+        replay('entry_type_100', entry, lambda w: root.type(w, 'x'*100))
+        replay('mbutton_hover', button, lambda w: (root.hover(w), root.leave(w)))
+        replay('live_config_text_1khz', live, updates)
+    finally:
+        root.destroy()
+    return results
+
+if __name__ == '__main__':
+    import json
+    json.dump(_scenarios(), sys.stdout, indent=2)
+    print()
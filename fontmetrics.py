@@ -0,0 +1,43 @@
+import tkinter as tk
+import collections
+
+from resources import Resources, font_key
+
+# Texts already measured, (font key, text, padx, pady): (width, height), most recently used last.
+# Sizes hold for every application, the fonts measuring them belong to the application of the widget asking
+_sizes = collections.OrderedDict()
+_SIZES = 4096
+
+def measure_text(widget: tk.Misc, text: str, font='TkDefaultFont', padding=(8, 8)):
+    """Function to get the size of text drawn with font, padded on each side, without any geometry pass
+
+    Keyword Arguments:
+        font    -- Any tk font description, named font or tkfont.Font(default-TkDefaultFont)
+
+        padding -- Tuple of (padx, pady) added on each side of the text(default-(8, 8)),
+                   which is the size a label gridded with ipadx=5 and ipady=5 gets
+    """
+    padx,pady = padding
+    key = (font_key(font), str(text), padx, pady)
+    size = _sizes.get(key)
+    if size is not None:
+        _sizes.move_to_end(key)
+        return size
+
+    f,linespace = Resources.of(widget).metrics(font)
+    lines = key[1].split('\n')
+    size = _sizes[key] = (max(f.measure(line) for line in lines) + 2*padx,linespace*len(lines) + 2*pady)
+    if len(_sizes) > _SIZES:
+        _sizes.popitem(last=False)
+    return size
+
+def clear_cache():
+    """Function to forget every measured text and linespace, for example after a named font is reconfigured"""
+    _sizes.clear()
+    for registry in Resources.instances():
+        registry.forget_metrics()
+
+if __name__ == '__main__':
+    root = tk.Tk()
+    print(measure_text(root, 'Tooltip 2\nSimple Tooltip 2'))
+    print(len(_sizes))
@@ -0,0 +1,192 @@
+import tkinter as tk
+import bisect
+import collections
+import functools
+import time
+
+# Upper bounds of the handler timing buckets in ms
+BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, float('inf'))
+
+# Canvas subcommands that edit items
+_CANVAS_OPS = {'create', 'coords', 'itemconfigure', 'delete', 'move', 'moveto', 'scale', 'lower', 'raise', 'addtag', 'dtag'}
+
+_enabled = False
+_clock = time.monotonic
+_current = None  # (widget path, event) of the running handler
+_counts = collections.defaultdict(collections.Counter)  # (widget path, event): Counter
+_timings = {}  # (widget path, event): _Histogram
+
+class _Histogram:
+    """Timing histogram of a handler"""
+    __slots__ = ('count', 'total', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0]*len(BUCKETS)
+
+    def add(self, ms):
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+        self.buckets[bisect.bisect_left(BUCKETS, ms)] += 1
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        self.buckets = [a + b for a,b in zip(self.buckets, other.buckets)]
+
+    def as_dict(self):
+        return {'count': self.count, 'total_ms': self.total, 'max_ms': self.max,
+                'mean_ms': self.total/self.count if self.count else 0.0,
+                'histogram': {f'<={b}': n for b,n in zip(BUCKETS, self.buckets) if n}}
+
+class _CountingTk:
+    """Stand-in for the tkapp of an application, counts every Tcl call before passing it on"""
+
+    def __init__(self, tkapp):
+        self._tkapp = tkapp
+        self._classes = {}  # Widget path: class, canvas subclasses and named canvases are found by their class
+
+    def __getattr__(self, name):
+        return getattr(self._tkapp, name)
+
+    def call(self, *args):
+        if _enabled:
+            words = args[0] if len(args) == 1 and isinstance(args[0], tuple) else args
+            if words[0] == 'destroy':  # The path can be made again with another class
+                for path in words[1:]:
+                    self._classes.pop(str(path), None)
+            _count(words, self._class)
+        return self._tkapp.call(*args)
+
+    def _class(self, path):
+        """Function to get the class of a widget, asked once per path"""
+        cls = self._classes.get(path)
+        if cls is None:
+            try:
+                cls = self._classes[path] = str(self._tkapp.call('winfo', 'class', path))
+            except tk.TclError:  # Not a widget
+                return ''
+        return cls
+
+def _count(args, classof):
+    """Function to record a Tcl call under the running handler, or the widget it was made on, classof gives
+    the class of a widget path"""
+    args = [str(a) for a in args[:2]]
+    if _current is not None:
+        key = _current
+    else:
+        path = next((a for a in args if a.startswith('.')), '.')
+        key = (path, 'other')
+
+    counter = _counts[key]
+    counter['tcl'] += 1
+    if args[0] == 'after' and args[1:] and args[1] not in ('cancel', 'info'):
+        counter['after'] += 1
+    elif args[0] == 'update':
+        counter['update'] += 1
+    elif args[0].startswith('.') and args[1:] and args[1] in _CANVAS_OPS and classof(args[0]) == 'Canvas':
+        counter['canvas'] += 1
+
+def _path(owner):
+    """Function to get the widget path stats of owner are kept under, tooltips are kept under their widget"""
+    if isinstance(owner, tk.Misc):
+        return str(owner)
+    target = getattr(owner, 'widget', None) or getattr(owner, 'master', None)
+    return str(target) if target is not None else '.'
+
+def handler(event):
+    """Decorator of the event handlers of a widget, times them and attributes their Tcl calls to event"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            global _current
+            if not _enabled:
+                return func(self, *args, **kwargs)
+
+            key,previous = (_path(self), event),_current
+            _current = key
+            start = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                _current = previous
+                _counts[key]['calls'] += 1
+                _timings.setdefault(key, _Histogram()).add((time.perf_counter() - start)*1000)
+        return wrapper
+    return decorate
+
+def now():
+    """Function to get the time in seconds the widgets measure delays and fades with, monotonic unless replaced"""
+    return _clock()
+
+def set_clock(clock=None):
+    """Function to replace the clock given by now, for example with a virtual one, None puts back the monotonic one,
+    returns the clock replaced"""
+    global _clock
+    previous,_clock = _clock,clock or time.monotonic
+    return previous
+
+def _walk(widget):
+    """Function to go through the widget and all of its children"""
+    yield widget
+    for child in widget.winfo_children():
+        yield from _walk(child)
+
+def enable(root: tk.Misc):
+    """Function to start counting, widgets made after this(and the existing ones of root) are followed"""
+    global _enabled
+    root = root._root()
+    tkapp = root.tk if isinstance(root.tk, _CountingTk) else _CountingTk(root.tk)
+    for widget in _walk(root):
+        widget.tk = tkapp
+    _enabled = True
+
+def disable(root: tk.Misc):
+    """Function to stop counting and give back the real tkapp to the widgets of root"""
+    global _enabled
+    root = root._root()
+    if isinstance(root.tk, _CountingTk):
+        tkapp = root.tk._tkapp
+        for widget in _walk(root):
+            widget.tk = tkapp
+    _enabled = False
+
+def reset():
+    """Function to forget every count and timing so far"""
+    _counts.clear()
+    _timings.clear()
+
+def stats(widget=None):
+    """Function to read the counts and timings, of a single widget(or tooltip) if given
+
+    Returns a dict with:
+        widgets  -- {path: {event: {'tcl', 'after', 'update', 'canvas', 'calls'}}}
+        handlers -- {event: {'count', 'total_ms', 'max_ms', 'mean_ms', 'histogram'}}
+    """
+    path = _path(widget) if widget is not None else None
+    widgets = collections.defaultdict(dict)
+    for (p,event),counter in _counts.items():
+        if path is None or p == path:
+            widgets[p][event] = dict(counter)
+
+    handlers = collections.defaultdict(_Histogram)
+    for (p,event),histogram in _timings.items():
+        if path is None or p == path:
+            handlers[event].merge(histogram)
+
+    return {'widgets': dict(widgets), 'handlers': {event: h.as_dict() for event,h in handlers.items()}}
+
+if __name__ == '__main__':
+    root = tk.Tk()
+    enable(root)
+
+    from mbuttons import MButton
+    b = MButton(root, text='HELLO')
+    b.pack()
+    b.event_generate('<Enter>')
+    b.event_generate('<Leave>')
+    print(stats(b))
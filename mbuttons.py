@@ -1,4 +1,61 @@
 import tkinter as tk
+import contextlib
+
+import instruments
+from fontmetrics import measure_text
+from resources import Resources
+from router import EventRouter
+
+class _HoverState:
+    """Normal and hovered colors of a button, kept compact"""
+    __slots__ = ('fg', 'bg', 'hovfg', 'hovbg')
+
+    def __init__(self, fg, bg, hovfg, hovbg):
+        self.fg,self.bg = fg,bg
+        self.hovfg,self.hovbg = hovfg,hovbg
+
+# Tcl procedures of batch, each one goes through all the buttons in a single evaluation
+_REQWIDTHS = '{args} {lmap w $args {expr {[winfo exists $w] ? [winfo reqwidth $w] : 0}}}'
+_WIDTHS = '{args} {foreach {w width} $args {if {[winfo exists $w]} {$w configure -width $width}}}'
+
+class _Batch:
+    """Buttons made inside batch, waiting for their padder"""
+    __slots__ = ('buttons', 'defaults')
+
+    def __init__(self):
+        self.buttons = []  # (button, padder)
+        self.defaults = {}  # (parent path, class): default fg and bg, read from the first button made there without them
+
+_batch = None
+
+@contextlib.contextmanager
+def batch():
+    """Context manager deferring the padder of the MButtons made in its block, their requested widths are read
+    in one Tcl evaluation on exit and the final widths applied together in another one
+
+        with batch():
+            for i in range(500):
+                MButton(toolbar, text=f'button {i}').grid(row=0, column=i)
+    """
+    global _batch
+    if _batch is not None:  # Nested, the outer block applies the widths
+        yield _batch
+        return
+
+    _batch = current = _Batch()
+    try:
+        yield current
+    finally:
+        _batch = None
+        groups = {}  # Buttons of each application
+        for button,padder in current.buttons:
+            groups.setdefault(button.tk, []).append((button, padder))
+        for tkapp,buttons in groups.items():
+            widths = tkapp.splitlist(tkapp.call('apply', _REQWIDTHS, *(str(button) for button,_ in buttons)))
+            args = []
+            for (button,padder),w in zip(buttons, widths):
+                args.extend((str(button), int(w) + padder))
+            tkapp.call('apply', _WIDTHS, *args)
 
 class MButton(tk.Button):
     """Simple button that responds to hover, additional arguments are:
@@ -9,37 +66,88 @@ class MButton(tk.Button):
         unit    -- If unit is px uses pixels for width and height else uses default units
 
     NOTE: These options cannot be changed with the config/configure method
+    Buttons made inside a batch() block get their padder applied together when it ends, and the default
+    colors are read once per parent, so option database entries naming single buttons are not followed
     """
     def __init__(self,master,hovfg: str='default',spacize: bool=False,hovbg: str='default',padder: int=30,unit: str='default',*args,**kwargs):
+
+        # to add a space between each character, given to the button as it is made
+        if spacize and 'text' in kwargs:
+            kwargs['text'] = ' '.join(str(kwargs['text']))
         
         # Initialization of the button
         if unit == 'px':
-            self.img = tk.PhotoImage(width=1,height=1)
+            self.img = Resources.of(master).image('pixel',width=1,height=1)  # Shared by every button
             tk.Button.__init__(self,master,image=self.img,compound='top',relief='flat',bd=0,*args,**kwargs)
         elif unit == 'default':
             tk.Button.__init__(self,master,bd=0,*args,**kwargs)
         else:
             raise TypeError(f"Unknown value '{unit}' option -unit. Must be 'px' or 'default'")
     
-        # to add a space between each character
-        if spacize:
-            new_txt = ' '.join(self['text'])
-            self['text'] = new_txt
+        if spacize and 'text' not in kwargs:  # text given in cnf
+            self['text'] = ' '.join(str(self['text']))
+
+        # Initial and hover colors, read back from the button only when not given
+        fg = kwargs.get('fg',kwargs.get('foreground'))
+        bg = kwargs.get('bg',kwargs.get('background'))
+        if fg is None or bg is None:
+            if _batch is None:
+                defaults = self.cget('fg'),self.cget('bg')
+            else:
+                key = (str(master),kwargs.get('class_','Button'))  # The option database can differ per parent
+                defaults = _batch.defaults.get(key)
+                if defaults is None:
+                    defaults = _batch.defaults[key] = self.cget('fg'),self.cget('bg')
+            fg,bg = fg or defaults[0],bg or defaults[1]
+        self.__hover = _HoverState(fg,bg,hovfg,hovbg)
+
+        # Set the new dimensions with padder, at the end of the batch if one is being made
+        if _batch is not None:
+            _batch.buttons.append((self,padder))
+        else:
+            w = self.winfo_reqwidth()  
+            self.config(width=w+padder)
+
+        # Events through the router, the application's own bindings on the button are left alone
+        router = EventRouter.of(self)
+        router.register(self,'<Enter>',self.enter)
+        router.register(self,'<Leave>',self.leave)
+
+    @property
+    def hovfg(self):
+        return self.__hover.hovfg
+
+    @hovfg.setter
+    def hovfg(self, color):
+        self.__hover.hovfg = color
 
-        self.hovfg = hovfg
-        self.hovbg = hovbg
+    @property
+    def hovbg(self):
+        return self.__hover.hovbg
 
-        # Initial colors 
-        self.fg,self.bg = self.cget('fg'),self.cget('bg')
+    @hovbg.setter
+    def hovbg(self, color):
+        self.__hover.hovbg = color
 
-        # Set the new dimensions with padder
-        w = self.winfo_reqwidth()  
-        self.config(width=w+padder)
+    @property
+    def fg(self):
+        """Initial foreground color"""
+        return self.__hover.fg
 
-        # Binding on the widgets
-        self.bind('<Enter>',self.enter)
-        self.bind('<Leave>',self.leave)
+    @fg.setter
+    def fg(self, color):
+        self.__hover.fg = color
 
+    @property
+    def bg(self):
+        """Initial background color"""
+        return self.__hover.bg
+
+    @bg.setter
+    def bg(self, color):
+        self.__hover.bg = color
+
+    @instruments.handler('enter')
     def enter(self,e):
         """Function to set colors on hover"""
         if (self.hovfg,self.hovbg) == ('default','default'):
@@ -47,18 +155,245 @@ class MButton(tk.Button):
         else:
             self.config(bg=self.hovbg,fg=self.hovfg)
 
+    @instruments.handler('leave')
     def leave(self,e):
-        """Function to change colors on mouse leave"""
-        if (self.hovfg,self.hovbg) == ('default','default'):
-            fg,bg = self.cget('fg'),self.cget('bg')
-            self.config(bg=fg,fg=bg)
+        """Function to change colors on mouse leave, back to the initial ones kept in python"""
+        self.config(bg=self.bg,fg=self.fg)
+
+class MButtonGrid(tk.Canvas):
+    """Panel of many hover buttons drawn as items of one canvas, only the buttons in view are drawn, additional arguments are:
+        buttons -- Texts of the buttons, or (text, command) tuples
+        columns -- Number of buttons in a row(default-10)
+        command -- Called with the index of a clicked button that has no command of its own
+        fg      -- Foreground color of the buttons(default-black)
+        bg      -- Background color of the buttons(default-#d9d9d9)
+        font    -- Font of the buttons(default-TkDefaultFont)
+        hovfg   -- Forground color when a button is hovered
+        hovbg   -- Background color when a button is hovered
+        spacize -- To add a empty space between each character
+        padder  -- Extra width to be provided for the buttons(depends on the unit option)
+        unit    -- If unit is px padder is in pixels else in characters
+
+    Every button gets the width of the widest one, scrolls like a canvas with xscrollcommand/yscrollcommand
+    """
+    def __init__(self,master,buttons=(),columns: int=10,command=None,fg: str='black',bg: str='#d9d9d9',font='TkDefaultFont',hovfg: str='default',hovbg: str='default',spacize: bool=False,padder: int=30,unit: str='default',**kwargs):
+        if unit not in ('px','default'):
+            raise TypeError(f"Unknown value '{unit}' option -unit. Must be 'px' or 'default'")
+        tk.Canvas.__init__(self,master,highlightthickness=0,**kwargs)
+
+        self.columns = columns
+        self.command = command
+        self.font = font
+        self.spacize = spacize
+        self.__colors = _HoverState(fg,bg,hovfg,hovbg)  # Shared by the buttons without colors of their own
+        self.__texts = []
+        self.__commands = []
+        self.__states = []
+        self.__items = {}  # Index: (rectangle, text) of the buttons drawn
+        self.__widest = 0
+        self.__view = None  # First and last columns and rows drawn
+        self.__origin = (0,0)  # Canvas coordinates of the top left corner
+        self.__hovered = None
+        self.__pressed = None
+
+        # Cell size, padder is in pixels or in widths of a character
+        f = Resources.of(self).font(font)
+        self.__padder = padder if unit == 'px' else padder*f.measure('0')
+        self.__height = f.metrics('linespace') + 8
+        self.__cell = (1,self.__height)
+
+        for button in buttons:
+            text,func = (button,None) if isinstance(button,str) else button
+            self.__append(text,func,None)
+        self.__layout()
+        if 'width' not in kwargs:
+            self.config(width=self.columns*self.__cell[0])
+        if 'height' not in kwargs:  # Up to 10 rows in view
+            self.config(height=min(self.__rows(),10)*self.__cell[1])
+
+        # Events through the router, the application's own bindings on the canvas are left alone
+        router = EventRouter.of(self)
+        for sequence,func in (('<Configure>',self.__render),('<Motion>',self.__motion),('<Leave>',self.__leave),
+                              ('<ButtonPress-1>',self.__press),('<ButtonRelease-1>',self.__release)):
+            router.register(self,sequence,func)
+
+    def __len__(self):
+        return len(self.__texts)
+
+    def __rows(self):
+        return -(-len(self.__texts)//self.columns)
+
+    def __append(self,text,command,state):
+        """Function to add a button without drawing it, returns True if the cells have to get wider"""
+        text = ' '.join(text) if self.spacize else text
+        self.__texts.append(text)
+        self.__commands.append(command)
+        self.__states.append(state or self.__colors)
+        w = measure_text(self,text,self.font,padding=(0,0))[0]
+        if w > self.__widest:
+            self.__widest = w
+            return True
+        return False
+
+    def add(self,text,command=None,fg=None,bg=None,hovfg=None,hovbg=None):
+        """Function to add a button at the end of the grid, colors not given are the ones of the grid"""
+        state = None
+        if (fg,bg,hovfg,hovbg) != (None,None,None,None):
+            colors = self.__colors
+            state = _HoverState(fg or colors.fg,bg or colors.bg,hovfg or colors.hovfg,hovbg or colors.hovbg)
+        rows = self.__rows()
+        if self.__append(text,command,state):
+            self.__layout()
         else:
-            self.config(bg=self.bg,fg=self.fg)
+            if self.__rows() != rows:  # A new row
+                self.__scrollregion()
+            self.__view = None
+            self.__render()
+        return len(self.__texts) - 1
+
+    def itemtext(self,index,text):
+        """Function to change the text of a button"""
+        self.__texts[index] = text = ' '.join(text) if self.spacize else text
+        w = measure_text(self,text,self.font,padding=(0,0))[0]
+        if w > self.__widest:
+            self.__widest = w
+            self.__layout()
+        elif index in self.__items:
+            self.itemconfig(self.__items[index][1],text=self.__texts[index])
+
+    def button_at(self,x,y):
+        """Function to get the index of the button under the x, y widget coordinates, or None"""
+        cw,ch = self.__cell
+        x,y = x + self.__origin[0],y + self.__origin[1]
+        if x < 0 or y < 0:
+            return None
+        column,row = int(x//cw),int(y//ch)
+        index = row*self.columns + column
+        if column >= self.columns or index >= len(self.__texts):
+            return None
+        return index
+
+    def invoke(self,index):
+        """Function to run the command of a button"""
+        command = self.__commands[index]
+        if command is not None:
+            return command()
+        if self.command is not None:
+            return self.command(index)
+
+    def __layout(self):
+        """Function to size the cells and the scrollable area, and draw the buttons in view again"""
+        self.__cell = self.__widest + self.__padder,self.__height
+        self.__scrollregion()
+        self.delete('button')
+        self.__items.clear()
+        self.__view = None
+        self.__render()
+
+    def __scrollregion(self):
+        cw,ch = self.__cell
+        self.config(scrollregion=(0,0,self.columns*cw,self.__rows()*ch))
+
+    def __colors_of(self,index):
+        """Function to get the fg and bg of a button, hovered or not"""
+        state = self.__states[index]
+        if index != self.__hovered:
+            return state.fg,state.bg
+        if (state.hovfg,state.hovbg) == ('default','default'):
+            return state.bg,state.fg
+        return (state.fg if state.hovfg == 'default' else state.hovfg,
+                state.bg if state.hovbg == 'default' else state.hovbg)
+
+    @instruments.handler('render')
+    def __render(self,e=None):
+        """Function to draw the buttons coming into view and delete the ones going out of it"""
+        cw,ch = self.__cell
+        x0,y0 = self.canvasx(0),self.canvasy(0)
+        self.__origin = (x0,y0)
+        x1,y1 = x0 + self.winfo_width(),y0 + self.winfo_height()
+        view = (max(int(x0//cw),0),min(int(x1//cw) + 1,self.columns),
+                max(int(y0//ch),0),min(int(y1//ch) + 1,self.__rows()))
+        if view == self.__view:
+            return
+        self.__view = c0,c1,r0,r1 = view
+
+        count = len(self.__texts)
+        visible = {index for row in range(r0,r1) for index in range(row*self.columns + c0,min(row*self.columns + c1,count))}
+        for index in self.__items.keys() - visible:
+            self.delete(*self.__items.pop(index))
+        for index in visible - self.__items.keys():
+            row,column = divmod(index,self.columns)
+            x,y = column*cw,row*ch
+            fg,bg = self.__colors_of(index)
+            self.__items[index] = (self.create_rectangle(x,y,x + cw - 1,y + ch - 1,fill=bg,outline='',tags='button'),
+                                   self.create_text(x + cw/2,y + ch/2,text=self.__texts[index],fill=fg,font=self.font,tags='button'))
+
+    def __paint(self,index):
+        """Function to recolor the items of a single button"""
+        items = self.__items.get(index)
+        if items is not None:
+            fg,bg = self.__colors_of(index)
+            self.itemconfig(items[0],fill=bg)
+            self.itemconfig(items[1],fill=fg)
+
+    def xview(self,*args):
+        result = tk.Canvas.xview(self,*args)
+        if args:
+            self.__render()
+        return result
+
+    def yview(self,*args):
+        result = tk.Canvas.yview(self,*args)
+        if args:
+            self.__render()
+        return result
+
+    def xview_moveto(self,fraction):
+        self.xview('moveto',fraction)
+
+    def xview_scroll(self,number,what):
+        self.xview('scroll',number,what)
+
+    def yview_moveto(self,fraction):
+        self.yview('moveto',fraction)
+
+    def yview_scroll(self,number,what):
+        self.yview('scroll',number,what)
+
+    @instruments.handler('motion')
+    def __motion(self,e):
+        """Function to move the hover to the button under the pointer"""
+        index = self.button_at(e.x,e.y)
+        if index != self.__hovered:
+            old,self.__hovered = self.__hovered,index
+            self.__paint(old)
+            self.__paint(index)
+
+    @instruments.handler('leave')
+    def __leave(self,e):
+        """Function to change colors on mouse leave"""
+        old,self.__hovered = self.__hovered,None
+        self.__paint(old)
+
+    def __press(self,e):
+        self.__pressed = self.button_at(e.x,e.y)
+
+    def __release(self,e):
+        index,self.__pressed = self.__pressed,None
+        if index is not None and index == self.button_at(e.x,e.y):
+            self.invoke(index)
 
 if __name__ == '__main__':
     root = tk.Tk()
 
     a = MButton(root,text='HELLO',bg='black',fg='white',hovfg='#fbc531',hovbg='#192a56',spacize=True,font=('calibri',21),unit='px')
     a.pack()
+
+    scroll = tk.Scrollbar(root)
+    grid = MButtonGrid(root,[str(i) for i in range(2000)],columns=20,hovfg='#fbc531',hovbg='#192a56',
+                       command=print,yscrollcommand=scroll.set)
+    scroll.config(command=grid.yview)
+    grid.pack(side='left')
+    scroll.pack(side='left',fill='y')
     
     root.mainloop()
\ No newline at end of file
@@ -1,23 +1,156 @@
 import tkinter as tk
 from tkinter import ttk
+import bisect
+import concurrent.futures
+
+import instruments
+from resources import Resources
+
+# States of the entry
+PLACEHOLDER = 'placeholder'  # showing the placeholder
+EMPTY = 'empty'  # empty and focused
+TEXT = 'text'  # holding typed text
+
+# Tcl procedures of PlaceholderForm, each one goes through all the fields in a single evaluation
+_GET = '{args} {lmap path $args {$path get}}'
+_SET = """{args} {
+    foreach {path text style cursor} $args {
+        $path configure -validate none
+        $path delete 0 end
+        $path insert 0 $text
+        $path configure -validate key
+        if {$style ne ""} {$path configure -style $style}
+        $path icursor $cursor
+    }
+}"""
+
+_executor = None  # worker of the substring and fuzzy searches, started on the first one
+
+def _search(index, text, fuzzy, within):
+    global _executor
+    if _executor is None:
+        _executor = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix='mtk-suggest')
+    return _executor.submit(index.search, text, fuzzy, within)
+
+def _subsequence(key, value):
+    """Function to check if the characters of key are found in value in the same order"""
+    chars = iter(value)
+    return all(c in chars for c in key)
+
+class PrefixIndex:
+    """Sorted array of values looked up with bisect, case insensitive and built once
+
+    A prefix extending the previous one is only looked up in the range found for that one
+    """
+    __slots__ = ('__keys', '__values', '__last')
+
+    def __init__(self, values):
+        pairs = sorted((str(v).casefold(), str(v)) for v in values)
+        self.__keys = [k for k,v in pairs]
+        self.__values = [v for k,v in pairs]
+        self.__last = ('', 0, len(pairs))  # previous prefix and its range
+
+    def __len__(self):
+        return len(self.__keys)
+
+    def prefix(self, prefix, limit=None):
+        """Function to get the values starting with prefix, up to limit of them"""
+        key = prefix.casefold()
+        last,lo,hi = self.__last
+        if not key.startswith(last):
+            lo,hi = 0,len(self.__keys)
+        lo = bisect.bisect_left(self.__keys, key, lo, hi)
+        hi = bisect.bisect_left(self.__keys, key + '\U0010ffff', lo, hi)
+        self.__last = (key, lo, hi)
+        return self.__values[lo:hi if limit is None else min(hi, lo + limit)]
+
+    def search(self, text, fuzzy=False, within=None):
+        """Function to get the positions of the values holding text, or its characters in order when fuzzy,
+        only the positions in within are looked at if given. Safe to run off the Tk thread"""
+        key = text.casefold()
+        keys = self.__keys
+        candidates = range(len(keys)) if within is None else within
+        if fuzzy:
+            return [i for i in candidates if _subsequence(key, keys[i])]
+        return [i for i in candidates if key in keys[i]]
+
+    def values(self, positions, limit=None):
+        """Function to get the values at positions, up to limit of them"""
+        return [self.__values[i] for i in positions[:limit]]
 
 class PlaceholderEntry(ttk.Entry):
     '''Custom modern Placeholder Entry box, takes positional argument master and placeholder\n
+    Additional Arguments:\n
+    fg - Color of the typed text(default-black)\n
+    placeholderfg - Color of the placeholder(default-grey)\n
+    font - Font of the typed text\n
+    placeholderfont - Font of the placeholder\n
+    suggestions - Values suggested in a dropdown while typing, indexed once\n
+    match - How values are matched, 'prefix'(default), 'substring' or 'fuzzy', the last two are searched off the Tk thread\n
+    limit - Most suggestions shown(default-10)\n
+    debounce - Time in ms typing has to pause for before suggesting(default-150)\n
+    Entries with other colors or fonts get their own style variant, so the shared styles are never touched\n
+    NOTE: validatecommand is used to follow the edits, the placeholder state is kept without reading the text back\n
+    A validatecommand given runs before it and can refuse edits, validate has to be 'key'(default) or 'all'\n
+    A textvariable is traced, values set through it are followed too\n
     
     BUG 1: Possible bugs with binding to this class\n
     BUG 2: Anomalous behaviour with config or configure method
     '''
 
-    def __init__(self, master, placeholder, **kwargs):
-        # Style for ttk widget
-        self.__s = ttk.Style()
-        self.__s.configure('my.TEntry', foreground='black', font=(0, 0, 'normal'))
-        self.__s.configure('placeholder.TEntry', foreground='grey', font=(0, 0, 'bold'))
+    def __init__(self, master, placeholder, fg='black', placeholderfg='grey', font=(0, 0, 'normal'), placeholderfont=(0, 0, 'bold'),
+                 suggestions=None, match='prefix', limit=10, debounce=150, **kwargs):
+        # Style for ttk widget, configured once per application
+        res = Resources.of(master)
+        self.__style = res.style('my.TEntry', foreground='black', font=(0, 0, 'normal'))
+        self.__placeholder_style = res.style('placeholder.TEntry', foreground='grey', font=(0, 0, 'bold'))
+        if (fg, font) != ('black', (0, 0, 'normal')):
+            self.__style = res.variant(self.__style, foreground=fg, font=font)
+        if (placeholderfg, placeholderfont) != ('grey', (0, 0, 'bold')):
+            self.__placeholder_style = res.variant(self.__placeholder_style, foreground=placeholderfg, font=placeholderfont)
 
-        # Init entry box
-        ttk.Entry.__init__(self, master,style='my.TEntry', **kwargs)
+        # Init entry box, edits are followed through the validation hook
+        validate = kwargs.pop('validate', 'key')
+        if validate not in ('key', 'all'):
+            raise tk.TclError(f"Unknown value '{validate}' for option -validate. Must be key or all")
+        command = kwargs.pop('validatecommand', None) or kwargs.pop('vcmd', None)
+        ttk.Entry.__init__(self, master,style=self.__style, **kwargs)
+        hook = f'{self.register(self.__validate)} %d %S'
+        if command:  # the caller's command first, refused edits are not counted, the placeholder is not its business
+            if callable(command):
+                command = self.register(command)
+            elif isinstance(command, (tuple, list)):
+                command = ' '.join(map(str, command))
+            internal = self.register(lambda: self.__internal)
+            hook = f'expr {{[{internal}] || ([{command}] && [{hook}])}}'
+        self.configure(validate=validate, validatecommand=hook)
         self.text = placeholder
-        self.__has_placeholder = False  # placeholder flag
+        self.__length = len(super().get())  # length of the typed text, kept without reading it back
+        self.__state = TEXT if self.__length else EMPTY  # one of PLACEHOLDER, EMPTY or TEXT
+        self.__internal = False  # set while the placeholder itself is inserted or deleted
+
+        # Writes to the variable from outside skip the validation hook, they are followed with a trace
+        self.__edited = False  # set by the hook, the write of the variable that follows is already counted
+        self.__readd = None  # pending return of the placeholder
+        self.__variable = str(kwargs['textvariable']) if kwargs.get('textvariable') else None
+        if self.__variable is not None:
+            self.__trace = self.register(self.__synced)
+            self.tk.call('trace', 'add', 'variable', self.__variable, 'write', self.__trace)
+
+        # Suggestions, the dropdown is made on first use
+        if match not in ('prefix', 'substring', 'fuzzy'):
+            raise tk.TclError(f"Unknown value '{match}' for option -match. Must be prefix, substring or fuzzy")
+        self.match = match
+        self.limit = limit
+        self.debounce = debounce
+        self.__index = None
+        self.__typed = 0.0  # time of the last edit
+        self.__job = None  # pending debounce
+        self.__query = 0  # counts searches, to drop the results of an older one
+        self.__matches = None  # (text, positions) of the last substring or fuzzy search
+        self.__dropdown = None
+        self.__listbox = None
+        self.__navigable = False  # dropdown keys bound, kept bound when suggestions are turned off
 
         # Add placeholder if box empty
         self.__add()
@@ -26,34 +159,235 @@ class PlaceholderEntry(ttk.Entry):
         self.bind('<FocusIn>', self.__clear)
         self.bind('<FocusOut>', self.__add)
         self.bind('<KeyRelease>',self.__normal)
+        self.bind('<Key>', self.__clear)  # clear the placeholder if starts typing
+        self.bind('<<Paste>>', self.__clear)
+        if suggestions is not None:
+            self.set_suggestions(suggestions)
+
+    @property
+    def status(self):
+        """Current state of the entry, one of PLACEHOLDER, EMPTY or TEXT"""
+        return self.__state
+
+    def __set_state(self, state):
+        """Function to move to another state, the style is switched only when it really changes"""
+        if state == self.__state:
+            return
+        if PLACEHOLDER in (state, self.__state):
+            self.configure(style=self.__placeholder_style if state == PLACEHOLDER else self.__style)
+        self.__state = state
+
+    @instruments.handler('validate')
+    def __validate(self, action, text):
+        """Validation hook, keeps count of the typed text from the inserted or deleted part only"""
+        if not self.__internal:
+            self.__edited = action in ('0', '1')  # followed by a write of the textvariable
+            if action == '1':  # insert
+                self.__length += len(text)
+            elif action == '0':  # delete
+                self.__length -= len(text)
+            if self.__state != PLACEHOLDER:
+                self.__set_state(TEXT if self.__length else EMPTY)
+            if self.__index is not None:
+                self.__changed()
+        return True
+
+    def __synced(self, *args):
+        """Function to follow a value set through the textvariable, the writes of the entry itself are skipped"""
+        if self.__internal or self.__edited:  # the placeholder, or an edit the hook already counted
+            self.__edited = False
+            return
+        self.__length = len(self.tk.globalgetvar(self.__variable))
+        self.__set_state(TEXT if self.__length else EMPTY)
+        if not self.__length and self.__readd is None and str(self.tk.call('focus')) != str(self):
+            self.__readd = self.after_idle(self.__readded)  # emptied while away, not from inside the trace
+
+    def __readded(self):
+        self.__readd = None
+        self.__add()
 
+    def destroy(self):
+        """Function to destroy the entry, its textvariable is left untraced"""
+        if self.__readd is not None:
+            self.after_cancel(self.__readd)
+            self.__readd = None
+        if self.__variable is not None:
+            try:
+                self.tk.call('trace', 'remove', 'variable', self.__variable, 'write', self.__trace)
+            except tk.TclError:  # the variable is gone
+                pass
+            self.__variable = None
+        super().destroy()
+
+    @instruments.handler('clear')
     def __clear(self, *args):
         """Function to clear the placeholder"""
-        if super().get() == self.text and self.__has_placeholder:  # remove placeholder when focus gain
+        if self.__state == PLACEHOLDER:  # remove placeholder when focus gain
+            self.__internal = True
             super().delete(0, tk.END)
-            self.configure(style='my.TEntry')
-            self.__has_placeholder = False  # set flag to false
+            self.__internal = False
+            self.__set_state(EMPTY)
 
+    @instruments.handler('add')
     def __add(self, *args):
         """Function to add the placeholder"""
-        if super().get() == '' and not self.__has_placeholder:  # if no text add placeholder
-            self.configure(style='placeholder.TEntry')
+        if self.__length == 0 and self.__state != PLACEHOLDER:  # if no text add placeholder
+            self.__set_state(PLACEHOLDER)
+            self.__internal = True
             super().insert(0, self.text)  # insert placeholder
+            self.__internal = False
             self.icursor(0)  # move insertion cursor to start of entrybox
-            self.__has_placeholder = True  # set flag to true
 
+    @instruments.handler('key')
     def __normal(self, *args):
         """Method to revert to normal properties"""
-        self.__add()  # if empty add placeholder
-        if super().get() == self.text and self.__has_placeholder:  # clear the placeholder if starts typing
-            self.bind('<Key>', self.__clear)
-            self.icursor(-1)  # keep insertion cursor to the end
+        self.__add()  # if emptied add placeholder
+
+    def set_suggestions(self, values):
+        """Function to index the values to suggest, None turns suggestions off"""
+        self.__index = None if values is None else PrefixIndex(values)
+        self.__matches = None
+        self.__hide_suggestions()
+        if not self.__navigable and self.__index is not None:
+            self.__navigable = True
+            for sequence in ('<Down>', '<Up>', '<Return>', '<Escape>'):
+                self.bind(sequence, self.__navigate, '+')
+            self.bind('<FocusOut>', lambda e: self.after(150, self.__hide_suggestions), '+')  # after a click on the dropdown
+
+    def __changed(self):
+        """Function to restart the debounce, a single timer is kept and pushed back when it fires too early"""
+        self.__typed = instruments.now()
+        if self.__job is None:
+            self.__job = self.after(self.debounce, self.__suggest)
+
+    @instruments.handler('suggest')
+    def __suggest(self):
+        """Function to look up the suggestions of the text typed so far"""
+        left = self.debounce - (instruments.now() - self.__typed)*1000
+        if left > 0:
+            self.__job = self.after(int(left) + 1, self.__suggest)
+            return
+        self.__job = None
+        self.__query += 1
+        if self.__state != TEXT or self.__index is None:
+            self.__hide_suggestions()
+            return
+
+        text = super().get()
+        if self.match == 'prefix':
+            self.__show_suggestions(self.__index.prefix(text, self.limit))
+            return
+
+        # Narrowed down from the matches of the previous text when this one extends it
+        key = text.casefold()
+        within = self.__matches[1] if self.__matches is not None and key.startswith(self.__matches[0]) else None
+        self.__poll(_search(self.__index, text, self.match == 'fuzzy', within), self.__query, key)
+
+    def __poll(self, future, query, key):
+        """Function to wait for a search on the worker, its results are dropped if another one started"""
+        if query != self.__query:
+            return
+        if not future.done():
+            self.after(16, self.__poll, future, query, key)
+            return
+        positions = future.result()
+        self.__matches = (key, positions)
+        self.__show_suggestions(self.__index.values(positions, self.limit))
+
+    def __show_suggestions(self, values):
+        """Function to list the values in the dropdown under the entry"""
+        if not values:
+            self.__hide_suggestions()
+            return
+        if self.__dropdown is None:
+            self.__dropdown = tk.Toplevel(self)
+            self.__dropdown.overrideredirect(1)
+            self.__listbox = tk.Listbox(self.__dropdown, activestyle='none', exportselection=False, takefocus=0, width=0)
+            self.__listbox.pack(fill='both', expand=True)
+            self.__listbox.bind('<ButtonRelease-1>', self.__clicked)
+
+        listbox = self.__listbox
+        listbox.delete(0, tk.END)
+        listbox.insert(tk.END, *values)
+        listbox.config(height=len(values))
+        self.__dropdown.minsize(self.winfo_width(), 1)
+        self.__dropdown.geometry(f'+{self.winfo_rootx()}+{self.winfo_rooty() + self.winfo_height()}')
+        self.__dropdown.deiconify()
+        self.__dropdown.lift()
+
+    def __hide_suggestions(self):
+        if self.__dropdown is not None and self.__dropdown.winfo_exists():
+            self.__dropdown.withdraw()
+
+    def __shown(self):
+        return self.__dropdown is not None and self.__dropdown.winfo_ismapped()
+
+    def __navigate(self, e):
+        """Function to move through the suggestions with the arrows, pick one with return or close them with escape"""
+        if not self.__shown():
+            return
+        listbox = self.__listbox
+        if e.keysym in ('Down', 'Up'):
+            current = listbox.curselection()
+            step = 1 if e.keysym == 'Down' else -1
+            i = current[0] + step if current else (0 if step == 1 else listbox.size() - 1)
+            i = max(0, min(i, listbox.size() - 1))
+            listbox.selection_clear(0, tk.END)
+            listbox.selection_set(i)
+            listbox.see(i)
+        elif e.keysym == 'Return':
+            current = listbox.curselection()
+            if not current:
+                return
+            self.__accept(listbox.get(current[0]))
+        else:
+            self.__hide_suggestions()
+        return 'break'
+
+    def __clicked(self, e):
+        current = self.__listbox.curselection()
+        if current:
+            self.__accept(self.__listbox.get(current[0]))
+
+    def __accept(self, value):
+        """Function to replace the text with the picked suggestion"""
+        self.__hide_suggestions()
+        self.__clear()
+        super().delete(0, tk.END)
+        super().insert(0, value)
+        self.icursor(tk.END)
+        self.focus_set()
+
+        # Not suggested again for the text just picked
+        if self.__job is not None:
+            self.after_cancel(self.__job)
+            self.__job = None
+        self.__query += 1
+
+    def _assign(self, value, focused):
+        """Function to follow a text written by PlaceholderForm without the validation hook,
+        returns the text, style('' if unchanged) and cursor to write, _assigned has to follow the write"""
+        self.__internal = True  # the textvariable trace skips the write
+        old = self.__state
+        self.__length = len(value)
+        if value:
+            self.__state,text = TEXT,value
+        elif focused:
+            self.__state,text = EMPTY,''
         else:
-            self.configure(style='my.TEntry')  # set normal font
+            self.__state,text = PLACEHOLDER,self.text
+
+        style = ''
+        if self.__state != old and PLACEHOLDER in (self.__state, old):
+            style = self.__placeholder_style if self.__state == PLACEHOLDER else self.__style
+        return text, style, 0 if self.__state == PLACEHOLDER else 'end'
+
+    def _assigned(self):
+        self.__internal = False
 
     def get(self):
         """Function to get the contents of the Entry widget"""
-        if super().get() == self.text and self.__has_placeholder:
+        if self.__state == PLACEHOLDER:
             return ''
         else:
             return super().get()
@@ -65,19 +399,85 @@ class PlaceholderEntry(ttk.Entry):
 
     def delete(self, first, last):
         """Function to delete text inside the Entry widget"""
-        if super().get() != self.text:
-            super().delete(first, last)
-            self.__add()
-        elif self.get() == self.text and not self.__has_placeholder:
+        if self.__state != PLACEHOLDER:
             super().delete(first, last)
             self.__add()
 
+class PlaceholderForm(ttk.Frame):
+    """Frame of named PlaceholderEntry fields read and written all at once, takes positional argument master
+
+    values, set_values and clear cost a single Tcl evaluation whatever the number of fields, the placeholder
+    state of each field is followed in python so only the fields holding text are read
+    """
+
+    def __init__(self, master, **kwargs):
+        ttk.Frame.__init__(self, master, **kwargs)
+        self.__fields = {}  # name: PlaceholderEntry
+
+    def add(self, name, placeholder, **kwargs):
+        """Function to make a field of the form, place it like any other widget"""
+        entry = self.__fields[name] = PlaceholderEntry(self, placeholder, **kwargs)
+        return entry
+
+    def __getitem__(self, name):
+        return self.__fields[name]
+
+    def __len__(self):
+        return len(self.__fields)
+
+    @property
+    def fields(self):
+        """Names of the fields in the order they were added"""
+        return list(self.__fields)
+
+    @instruments.handler('values')
+    def values(self):
+        """Function to get the text of every field, '' for the ones showing the placeholder"""
+        values = dict.fromkeys(self.__fields, '')
+        typed = [(name, entry) for name,entry in self.__fields.items() if entry.status == TEXT]
+        if typed:
+            texts = self.tk.splitlist(self.tk.call('apply', _GET, *(str(entry) for _,entry in typed)))
+            for (name,_),text in zip(typed, texts):
+                values[name] = text
+        return values
+
+    @instruments.handler('set_values')
+    def set_values(self, values):
+        """Function to write the texts of the fields named in values, emptied fields get their placeholder back"""
+        entries = [(self.__fields[name], value) for name,value in values.items()]  # Unknown names raise before any change
+        focused = self.tk.call('focus')
+        args = []
+        for entry,value in entries:
+            args.append(str(entry))
+            args.extend(entry._assign(str(value), str(entry) == str(focused)))
+        try:
+            if args:
+                self.tk.call('apply', _SET, *args)
+        finally:
+            for entry,_ in entries:
+                entry._assigned()
+
+    def clear(self):
+        """Function to empty every field"""
+        self.set_values(dict.fromkeys(self.__fields, ''))
+
 if __name__ == '__main__':
     root = tk.Tk()
     e = PlaceholderEntry(root,placeholder='Enter your name: ')
     e.pack(padx=10,pady=10)
 
+    s = PlaceholderEntry(root,placeholder='Host: ',suggestions=[f'host-{i:06}.example.com' for i in range(100000)],match='substring')
+    s.pack(padx=10,pady=10)
+
     b = ttk.Button(root,text='FOCUS!',command=lambda: print(len(e.get())))
     b.pack()
 
+    form = PlaceholderForm(root)
+    form.pack(padx=10,pady=10)
+    for i in range(5):
+        form.add(f'field{i}', f'Field {i}: ').pack()
+    form.set_values({'field0': 'hello', 'field3': 'world'})
+    ttk.Button(root,text='VALUES',command=lambda: print(form.values())).pack()
+    ttk.Button(root,text='CLEAR',command=form.clear).pack()
+
     root.mainloop()
\ No newline at end of file
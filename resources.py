@@ -0,0 +1,91 @@
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+
+from application import PerApplication
+
+def font_key(font):
+    """Function to get a hashable key of a font description or option value, a tkfont.Font is keyed by its name
+    and a list by the tuple of its items"""
+    if isinstance(font, tkfont.Font):
+        return font.name
+    if isinstance(font, (list, tuple)):
+        return tuple(font_key(item) for item in font)
+    return font
+
+class Resources(PerApplication):
+    """Registry of the styles, fonts and helper images of an application, each one is created once
+    and the same handle is handed out to every widget asking for it
+
+    Styles are configured only the first time they are asked for, so building a new widget never
+    restyles the ones already in use
+    """
+
+    def __init__(self, master: tk.Misc):
+        super().__init__(master)
+        self.__style    = None
+        self.__styles   = set()  # Names of the styles already configured
+        self.__variants = {}  # (base, options): style name
+        self.__fonts    = {}  # Font key: tkfont.Font
+        self.__metrics  = {}  # Font key: (tkfont.Font, linespace)
+        self.__images   = {}  # (name, options): tk.PhotoImage
+
+    @property
+    def ttkstyle(self):
+        """The ttk.Style of the application"""
+        if self.__style is None:
+            self.__style = ttk.Style(self.master)
+        return self.__style
+
+    def style(self, name, **options):
+        """Function to configure the named ttk style with options once, later calls only return the name"""
+        if name not in self.__styles:
+            self.ttkstyle.configure(name, **options)
+            self.__styles.add(name)
+        return name
+
+    def variant(self, base, **options):
+        """Function to get a style derived from base with options on top, one style per distinct options"""
+        key = (base, tuple(sorted((option, font_key(value)) for option,value in options.items())))
+        name = self.__variants.get(key)
+        if name is None:
+            name = self.__variants[key] = f'mtk{len(self.__variants)}.{base}'  # Inherits from base
+            self.style(name, **options)
+        return name
+
+    def font(self, font):
+        """Function to get the shared tkfont.Font of a font description, a tkfont.Font is shared as it is"""
+        key = font_key(font)
+        f = self.__fonts.get(key)
+        if f is None:
+            f = self.__fonts[key] = font if isinstance(font, tkfont.Font) else tkfont.Font(root=self.master, font=font)
+        return f
+
+    def metrics(self, font):
+        """Function to get the shared tkfont.Font of a font description with its linespace, read once"""
+        key = font_key(font)
+        metrics = self.__metrics.get(key)
+        if metrics is None:
+            f = self.font(font)
+            metrics = self.__metrics[key] = (f, f.metrics('linespace'))
+        return metrics
+
+    def forget_metrics(self):
+        """Function to read the linespaces again, for example after a named font is reconfigured"""
+        self.__metrics.clear()
+
+    def image(self, name, **options):
+        """Function to get a shared helper tk.PhotoImage, created from options the first time name is asked for"""
+        key = (name, tuple(sorted(options.items())))
+        image = self.__images.get(key)
+        if image is None:
+            image = self.__images[key] = tk.PhotoImage(master=self.master, **options)
+        return image
+
+if __name__ == '__main__':
+    root = tk.Tk()
+    res = Resources.of(root)
+
+    print(res.style('my.TEntry', foreground='black'))
+    print(res.variant('my.TEntry', foreground='red'))
+    print(res.image('pixel', width=1, height=1) is Resources.of(root).image('pixel', width=1, height=1))
@@ -1,4 +1,549 @@
 import tkinter as tk
+import abc
+import asyncio
+import collections
+import concurrent.futures
+import itertools
+import queue
+import sys
+import threading
+import weakref
+import math
+from collections.abc import Callable
+
+import instruments
+from application import PerApplication
+from fontmetrics import measure_text
+from router import EventRouter
+
+# Tooltips still attached to a widget, they leave on their own once torn down
+_live = weakref.WeakSet()
+
+def live_tooltips():
+    """Function to get the tooltips still attached to a widget"""
+    return list(_live)
+
+class _ToolTipWindow:
+    """One pooled tooltip window, re-skinned with whichever tooltip it is lent to"""
+    def __init__(self, master, destroyed):
+        # Making the window
+        self.master = tk.Toplevel(master)
+        self.master.attributes('-alpha', 0)  # Hide the window
+        self.master.overrideredirect(1)
+        self.master.attributes('-topmost', True)
+        if self.master._windowingsystem == 'win32':  # Only windows knows -transparentcolor
+            self.master.attributes('-transparentcolor', '#f0f0f0')  # Green key
+
+        self.frame = tk.Frame(self.master)
+        self.frame.pack(expand=1, fill='x')
+        self.background = self.frame.cget('bg')
+
+        # Skins, only one of them is gridded at a time
+        self.canvas = tk.Canvas(self.frame)  # RoundedToolTip
+        self.label = tk.Label(self.frame, justify=tk.LEFT)  # ToolTip
+
+        # Out of the all tag, so moving the window does not invalidate the cached placements
+        for widget in (self.master, self.frame, self.canvas, self.label):
+            widget.bindtags(tuple(tag for tag in widget.bindtags() if tag != 'all'))
+
+        # Destroyed from outside(like when every child of root is cleared for a new page), the pool lets it go
+        command = self.master.register(lambda: destroyed(self))
+        self.master.bind('<Destroy>', f'if {{"%W" eq "{self.master}"}} {{{command}}}')
+
+        self.owner = None  # Tooltip the window is skinned with
+        self.busy = False  # Whether the owner is still showing it
+        self.alpha = 0  # Opacity, kept here so it is never read back from tk
+
+    def set_alpha(self, alpha):
+        """Function to change the opacity of the window, only when it really changes"""
+        if alpha != self.alpha:
+            self.alpha = alpha
+            self.master.attributes('-alpha', alpha)
+
+class ToolTipPool(PerApplication):
+    """Small fixed set of tooltip windows shared by every tooltip of an application,
+    only one tooltip is visible at a time so the windows are re-skinned when lent
+
+    Keyword Arguments:
+        size -- Number of windows kept by the pool(default-1), when all of them are busy
+                the least recently lent one is taken over
+    """
+
+    def __init__(self, master: tk.Misc, size: int=1):
+        super().__init__(master)
+        self.size = size
+        self.__windows = []  # Least recently lent first
+        EventRouter.of(self.master).on_suppress(self.hide)
+
+    def __len__(self):
+        return len(self.__windows)
+
+    def __pick(self, owner):
+        """Function to choose the window to lend to the tooltip"""
+        for window in self.__windows:  # Already skinned with it
+            if window.owner is owner:
+                return window
+        for window in self.__windows:  # Not in use
+            if not window.busy:
+                return window
+        if len(self.__windows) < self.size:
+            window = _ToolTipWindow(self.master, self.__destroyed)
+            self.__windows.append(window)
+            return window
+        return self.__windows[0]  # Take over the least recently lent one
+
+    def __destroyed(self, window):
+        """Function to drop a window destroyed from outside, its tooltip gets a new one on its next show"""
+        if window in self.__windows:
+            self.__windows.remove(window)
+            if window.owner is not None:
+                window.owner._evict()
+
+    def acquire(self, owner):
+        """Function to lend a window to the tooltip, re-skinning it if it was skinned with another one"""
+        window = self.__pick(owner)
+        self.__windows.remove(window)
+        self.__windows.append(window)
+
+        if window.owner is not owner:
+            if window.owner is not None:
+                window.owner._evict()
+            window.owner = owner
+            owner._skin(window)
+        window.busy = True
+        return window
+
+    def release(self, owner):
+        """Function to give back the window, it keeps its skin until lent to another tooltip"""
+        for window in self.__windows:
+            if window.owner is owner:
+                window.busy = False
+
+    def hide(self):
+        """Function to hide every shown tooltip at once, except the ones made with onpress=False"""
+        for window in self.__windows:
+            if window.busy and window.owner is not None and getattr(window.owner, 'onpress', True):
+                window.owner.clear()
+
+    def forget(self, owner):
+        """Function to drop every reference to a torn down tooltip"""
+        for window in self.__windows:
+            if window.owner is owner:
+                window.owner = None
+                window.busy = False
+
+class Placer(PerApplication):
+    """Placement of the tooltips of an application, the root geometry of the widgets they annotate and the
+    screen size are cached, the cached geometry is dropped whenever a measured widget or one of its ancestors
+    is configured or mapped, which is the only time it can change
+
+    The invalidation is bound on the Placer's own bind tag put on those widgets, so bindings of the
+    application(even bind_all without '+') can't replace it
+
+    A tooltip not fitting on the screen on its side is flipped to the opposite one, then kept inside the screen
+    """
+    _opposite = {'right': 'left', 'left': 'right', 'top': 'bottom', 'bottom': 'top'}
+    _tag = 'MtkPlacer'
+
+    def __init__(self, master: tk.Misc):
+        super().__init__(master)
+        self.__rects = {}  # Widget path: root x, y, width and height
+        self.__watched = set()  # Paths of the widgets carrying the tag
+        self.__screen = None
+
+        # Plain Tcl commands, the events are not converted for python
+        invalidate = self.master.register(self.invalidate)
+        for sequence in ('<Configure>', '<Map>'):
+            self.master.tk.call('bind', Placer._tag, sequence, invalidate)
+        self.master.tk.call('bind', Placer._tag, '<Destroy>', self.master.register(self.__destroyed) + ' %W')
+
+    def __len__(self):
+        return len(self.__rects)
+
+    def invalidate(self):
+        """Function to drop every cached geometry"""
+        self.__rects.clear()
+
+    def __watch(self, widget):
+        """Function to put the tag on the widget and its ancestors, the ones whose geometry moves it"""
+        while widget is not None and str(widget) not in self.__watched:
+            tags = widget.bindtags()
+            if Placer._tag not in tags:  # First, so a 'break' of the widget's own bindings can't skip it
+                widget.bindtags((Placer._tag,) + tags)
+            self.__watched.add(str(widget))
+            widget = widget.master
+
+    def __destroyed(self, path):
+        """Function to forget a destroyed widget, a new one may get its path"""
+        self.__watched.discard(path)
+        self.__rects.pop(path, None)
+
+    def rect(self, widget):
+        """Function to get the root x, y, width and height of the widget"""
+        path = str(widget)
+        rect = self.__rects.get(path)
+        if rect is None:
+            self.__watch(widget)
+            rect = self.__rects[path] = (widget.winfo_rootx(), widget.winfo_rooty(), widget.winfo_width(), widget.winfo_height())
+        return rect
+
+    def contains(self, widget, x, y):
+        """Function to check if the root x, y is over the widget"""
+        rx,ry,w,h = self.rect(widget)
+        return rx <= x < rx + w and ry <= y < ry + h
+
+    def pointer(self):
+        """Function to get the root x, y of the pointer"""
+        return self.master.winfo_pointerxy()
+
+    def screen(self):
+        if self.__screen is None:
+            self.__screen = (self.master.winfo_screenwidth(), self.master.winfo_screenheight())
+        return self.__screen
+
+    def place(self, rect, size, side):
+        """Function to get the root x, y of a window of size next to rect, and the side it went on"""
+        x,y,width,height = rect
+        w,h = size
+        side = side.lower()
+        spots = {'right': (x + width, y + 2), 'left': (x - w, y + 5), 'top': (x, y - h), 'bottom': (x, y + height)}
+        if side not in spots:
+            raise tk.TclError(f"Unknown value '{side}' for option -side. Must be right, left, top or bottom")
+        sw,sh = self.screen()
+
+        def fits(side):
+            px,py = spots[side]
+            if side in ('right', 'left'):
+                return 0 <= px and px + w <= sw
+            return 0 <= py and py + h <= sh
+
+        if not fits(side) and fits(Placer._opposite[side]):
+            side = Placer._opposite[side]
+        px,py = spots[side]
+        return max(0, min(px, sw - w)),max(0, min(py, sh - h)),side
+
+class HoverScheduler(PerApplication):
+    """Hover-intent timer shared by every tooltip of an application, the pointer is over one
+    widget at a time so a single `after` is armed per hover instead of polling
+
+    The delay is measured against a monotonic clock, if the timer fires early(or the hover was
+    pushed back by pointer motion) it is re-armed for the remaining time only
+    """
+
+    def __init__(self, master: tk.Misc):
+        super().__init__(master)
+        self.__job      = None
+        self.__owner    = None
+        self.__callback = None
+        self.__args     = ()
+        self.__delay    = 0
+        self.__due      = 0.0
+        self.__still    = False
+
+    @property
+    def pending(self):
+        """Owner of the armed hover, None if nothing is armed"""
+        return self.__owner
+
+    def arm(self, owner, delay, callback, *args, still=False):
+        """Function to call back once the pointer stayed over the owner for delay ms, replaces any armed hover
+
+        If still is True the delay restarts on every call to moved, so it only fires once the pointer stops
+        """
+        self.cancel()
+        self.__owner    = owner
+        self.__callback = callback
+        self.__args     = args
+        self.__delay    = delay
+        self.__still    = still
+        self.__due      = instruments.now() + delay/1000
+        self.__job      = self.master.after(delay, self.__fire)
+
+    def moved(self, owner):
+        """Function to push back the armed hover of the owner when the pointer moves, if it waits for stillness"""
+        if self.__owner is owner and self.__still:
+            self.__due = instruments.now() + self.__delay/1000
+
+    def cancel(self, owner=None):
+        """Function to drop the armed hover, only if it belongs to owner when given"""
+        if owner is not None and owner is not self.__owner:
+            return
+        if self.__job is not None:
+            self.master.after_cancel(self.__job)
+        self.__job      = None
+        self.__owner    = None
+        self.__callback = None
+        self.__args     = ()
+
+    @instruments.handler('hover')
+    def __fire(self):
+        """Function to run the callback once the delay has really elapsed"""
+        remaining = self.__due - instruments.now()
+        if remaining > 0.001:  # Fired early or pushed back by motion
+            self.__job = self.master.after(math.ceil(remaining*1000), self.__fire)
+            return
+
+        callback,args = self.__callback,self.__args
+        self.__job = None
+        self.cancel()
+        callback(*args)
+
+def _span(y, x1, y1, x2, y2, radius):
+    """Function to get the first and last pixel of row y whose centers are inside the rounded rectangle, None if there are none"""
+    py = y + 0.5
+    if not (y1 <= py < y2):
+        return None
+    # Distance to the center of the nearest corner, only the rows of the corner squares get shorter
+    cy = min(max(py, y1 + radius), y2 - radius)
+    reach = radius**2 - (py - cy)**2
+    if reach < 0:
+        return None
+    dx = math.sqrt(reach)
+    first = math.ceil(max(x1, x1 + radius - dx) - 0.5)
+    last = min(math.floor(x2 - radius + dx - 0.5), math.ceil(x2 - 0.5) - 1)
+    return (first, last) if first <= last else None
+
+class BoxImageCache(PerApplication):
+    """Bounded cache of pre-rendered rounded boxes with their drop shadow, shared by the tooltips of an application,
+    a box is rendered once per size and colors and drawn as a single image item afterwards
+
+    Keyword Arguments:
+        size -- Number of images kept, least recently used ones are dropped first(default-64)
+    """
+
+    def __init__(self, master: tk.Misc, size: int=64):
+        super().__init__(master)
+        self.size = size
+        self.__images = collections.OrderedDict()
+        self.__colors = {}  # Color name: (r, g, b) in 0-255
+
+    def __len__(self):
+        return len(self.__images)
+
+    def get(self, w, h, radius, fill, outline, shadow=None, steps=3, background='#f0f0f0'):
+        """Function to get the image of the box from (5,5) to (w,h), with a shadow of steps px fading out from shadow to background"""
+        key = (w, h, radius, fill, outline, shadow, steps, background)
+        image = self.__images.get(key)
+        if image is None:
+            image = self.__images[key] = self.__render(*key)
+            while len(self.__images) > self.size:
+                self.__images.popitem(last=False)
+        self.__images.move_to_end(key)
+        return image
+
+    def __rgb(self, color):
+        """Function to get the 8 bit rgb value of a color"""
+        rgb = self.__colors.get(color)
+        if rgb is None:
+            rgb = self.__colors[color] = tuple(c >> 8 for c in self.master.winfo_rgb(color))
+        return rgb
+
+    def __blend(self, first, last, t):
+        """Function to mix two colors, t going from 0(first) to 1(last)"""
+        first,last = self.__rgb(first),self.__rgb(last)
+        return '#%02x%02x%02x' % tuple(round(a + (b - a)*t) for a,b in zip(first, last))
+
+    def __render(self, w, h, radius, fill, outline, shadow, steps, background):
+        """Function to draw the box row by row with runs of a single color, pixels outside of it are left transparent"""
+        steps = steps if shadow is not None else 0
+        radius = min(radius, (w - 5)/2, (h - 5)/2)
+        fill,outline = self.__blend(fill, fill, 0),self.__blend(outline, outline, 0)
+        shades = [self.__blend(shadow, background, i/(steps + 1)) for i in range(1, steps + 1)]
+        image = tk.PhotoImage(master=self.master, width=w + steps, height=h + steps)
+
+        # Shapes are convex and nested, so each band is one run per row painted over the wider ones
+        box = [_span(y, 5, 5, w, h, radius) for y in range(-1, h + steps + 1)]
+        for y in range(h + steps):
+            for i,shade in reversed(list(enumerate(shades, 1))):  # Softer the further out
+                span = _span(y, 5, 5, w + i, h + i, radius)
+                if span is not None:
+                    image.put(shade, to=(span[0], y, span[1] + 1, y + 1))
+            above,span,below = box[y:y + 3]
+            if span is None:
+                continue
+            image.put(outline, to=(span[0], y, span[1] + 1, y + 1))
+            # Inside pixels with all four neighbours inside the box are filled, the others are its outline
+            if above is not None and below is not None:
+                first,last = max(span[0] + 1, above[0], below[0]),min(span[1] - 1, above[1], below[1])
+                if first <= last:
+                    image.put(fill, to=(first, y, last + 1, y + 1))
+        return image
+
+def _ease(t):
+    """Smoothstep easing of the animation progress t, from 0 to 1"""
+    return t*t*(3 - 2*t)
+
+class Animator(PerApplication):
+    """Animation clock shared by every tooltip of an application, a single frame callback drives
+    all the running fades and it stops when none are left
+
+    Fades are time based, so a full fade takes its duration however busy the event loop is
+
+    Keyword Arguments:
+        interval -- Time between two frames in ms(default-16)
+    """
+
+    def __init__(self, master: tk.Misc, interval: int=16):
+        super().__init__(master)
+        self.interval = interval
+        self.__fades = {}  # Window: (start, duration, from, to, callback)
+        self.__job = None
+
+    def __len__(self):
+        return len(self.__fades)
+
+    def fade(self, window, alpha, duration, callback=None):
+        """Function to fade a pooled window to alpha in duration ms, superseding its running fade
+
+        A fade that starts halfway(like a fadeout during a fadein) takes the matching part of the duration,
+        callback is called once the fade is over
+        """
+        self.cancel(window)
+        start = window.alpha
+        duration = duration/1000 * abs(alpha - start)
+        if duration <= 0:
+            window.set_alpha(alpha)
+            if callback is not None:
+                callback()
+            return
+
+        self.__fades[window] = (instruments.now(), duration, start, alpha, callback)
+        if self.__job is None:
+            self.__job = self.master.after(self.interval, self.__frame)
+
+    def cancel(self, window):
+        """Function to stop the running fade of the window, leaving its alpha as it is"""
+        self.__fades.pop(window, None)
+
+    def running(self, window):
+        """Function to check if the window is being faded"""
+        return window in self.__fades
+
+    @instruments.handler('frame')
+    def __frame(self):
+        """Function to step every running fade to the current time"""
+        now = instruments.now()
+        done = []
+        for window,(start,duration,first,last,callback) in list(self.__fades.items()):
+            t = min((now - start)/duration, 1)
+            window.set_alpha(first + (last - first)*_ease(t))
+            if t >= 1:
+                del self.__fades[window]
+                done.append(callback)
+
+        # Pause the clock when nothing is animating
+        self.__job = self.master.after(self.interval, self.__frame) if self.__fades else None
+
+        for callback in done:
+            if callback is not None:
+                callback()
+
+# Step the width of live tooltips grows and shrinks by, in px
+_LIVE_STEP = 16
+
+class TextResolver(PerApplication):
+    """Resolves the text providers of the tooltips of an application away from the Tk thread, plain callables run
+    on a thread pool and coroutine functions on an asyncio loop, results come back to the Tk thread through a queue
+
+    Resolved texts are cached per tooltip until their ttl runs out, the least recently used ones are dropped first.
+    A tooltip has one provider call running at a time, asking again meanwhile only waits for its text
+
+    Keyword Arguments:
+        size    -- Number of resolved texts cached(default-1024)
+
+        workers -- Threads running the callable providers(default-4)
+
+        loop    -- Running asyncio loop for the coroutine providers, one is started on a thread if not given
+    """
+
+    def __init__(self, master: tk.Misc, size: int=1024, workers: int=4, loop=None):
+        super().__init__(master)
+        self.size = size
+        self.workers = workers
+        self.__loop = loop
+        self.__executor = None
+        self.__cache = collections.OrderedDict()  # weakref to tooltip: (text, expiry)
+        self.__results = queue.SimpleQueue()  # (text, error, key, ttl) from the workers
+        self.__running = {}  # weakref to tooltip: callbacks waiting for its provider call
+        self.__pending = 0
+        self.__job = None
+
+    def __len__(self):
+        return len(self.__cache)
+
+    def cached(self, owner):
+        """Function to get the cached text of the tooltip, None if there is none or it expired"""
+        key = weakref.ref(owner)
+        entry = self.__cache.get(key)
+        if entry is None:
+            return None
+        if entry[1] < instruments.now():
+            del self.__cache[key]
+            return None
+        self.__cache.move_to_end(key)
+        return entry[0]
+
+    def forget(self, owner):
+        """Function to drop the cached text of the tooltip"""
+        self.__cache.pop(weakref.ref(owner), None)
+
+    def resolve(self, owner, provider, ttl, callback):
+        """Function to run the provider off the Tk thread, callback gets the text on the Tk thread, ttl is in ms"""
+        key = weakref.ref(owner)
+        callbacks = self.__running.get(key)
+        if callbacks is not None:  # Already running, the text goes to every callback
+            callbacks.append(callback)
+            return
+        self.__running[key] = [callback]
+
+        def done(future):
+            error = future.exception()
+            self.__results.put((None if error else future.result(), error, key, ttl))
+
+        if asyncio.iscoroutinefunction(provider):
+            if self.__loop is None:
+                self.__loop = asyncio.new_event_loop()
+                threading.Thread(target=self.__loop.run_forever, name='mtk-text-loop', daemon=True).start()
+            future = asyncio.run_coroutine_threadsafe(provider(), self.__loop)
+        else:
+            if self.__executor is None:
+                self.__executor = concurrent.futures.ThreadPoolExecutor(self.workers, thread_name_prefix='mtk-text')
+            future = self.__executor.submit(provider)
+
+        self.__pending += 1
+        future.add_done_callback(done)
+        if self.__job is None:
+            self.__job = self.master.after(16, self.__drain)
+
+    def __drain(self):
+        """Function to hand the resolved texts to their tooltips, polling only while some are pending"""
+        try:
+            while True:
+                try:
+                    text,error,key,ttl = self.__results.get_nowait()
+                except queue.Empty:
+                    break
+                self.__pending -= 1
+                callbacks = self.__running.pop(key, ())
+                try:
+                    if error is not None:
+                        raise error
+                    text = str(text)
+                    if ttl > 0 and key() is not None:
+                        self.__cache[key] = (text, instruments.now() + ttl/1000)
+                        self.__cache.move_to_end(key)
+                        while len(self.__cache) > self.size:
+                            self.__cache.popitem(last=False)
+                except Exception:  # A bad result does not stop the others
+                    self.master.report_callback_exception(*sys.exc_info())
+                    continue
+                for callback in callbacks:
+                    try:
+                        callback(text)
+                    except Exception:  # Nor does a bad callback
+                        self.master.report_callback_exception(*sys.exc_info())
+        finally:
+            self.__job = self.master.after(16, self.__drain) if self.__pending else None
 
 class RoundedToolTip:
     """Custom rounded tooltips, easy to use, specify widget and text as positional arguments
@@ -19,16 +564,45 @@ class RoundedToolTip:
         fadein      -- Default is set to 'enabled', set to 'disabled' to disable fadein of the tooltip
 
         fadeout     -- Default is set to 'enabled', set to 'disabled' to disable fadeout of the tooltip
+
+        fadetime    -- Time taken by a full fadein or fadeout in ms(default-200)
         
         shadowed    -- Default is set to True, gives a drop shadow effect
         
         shadowcolor -- Default set to 'black', changes the color of the drop shadow, if enabled
         
-        side        -- Default is set to 'right', change side to 'left' for tooltip on left side
+        side        -- Default is set to 'right', can be 'left', 'top' or 'bottom', flipped to the opposite side
+                       when the tooltip does not fit on the screen
         
         onpress     -- Default is True, hides tooltip on press of other key or left mousclick
+
+        still       -- Default is False, set to True to wait for the pointer to stop moving before the delay ends
+
+        lazy        -- Default is True, measures and draws the tooltip on its first show instead of when attached
+
+        render      -- Default is 'polygon', set to 'image' to draw the box and shadow as one cached image
+
+        shadowsteps -- Width of the drop shadow in px(default-3), the 'image' render fades it out softly
+
+        loadingtext -- Default is '...', shown while a text provider is being resolved
+
+        textttl     -- Time a resolved text is cached for in ms(default-30000), 0 resolves it on every show
+
+        live        -- Default is False, set to True for texts updated many times a second, config_text then
+                       draws only the latest text once per frame, nothing while hidden, and the box grows
+                       in steps of 16px so it is not relaid out on every small change
+
+    The text can also be a callable or a coroutine function giving the text, it is resolved off the Tk thread
+    when the pointer enters the widget, results arriving after the pointer left are not shown
+
+    The tooltip tears itself down when the widget is destroyed
     """
-    def __init__(self, widget: tk.Widget, text: str, triggerkey: str='<Enter>', releasekey: str='<Leave>', bg: str='white', delayed: bool=True, delaytime: int=1000, fg: str='black', fadeout: str='enabled', fadein: str='enabled', shadowed: bool=True, shadowcolor: str='black', outlinecolor: str='black', side: str='right', onpress: bool=True):
+    __slots__ = ('widget', 'text', 'bg', 'fg', 'fadeout', 'fadein', 'side', 'onpress', 'delayed', 'delaytime', 'shadowed',
+                 'shadowcolor', 'outlinecolor', 'lazy', 'still', 'fadetime', 'render', 'shadowsteps', 'x', 'y', '_anchor',
+                 'loadingtext', 'textttl', 'live', '__hidden', '__window', '__size', '__box', '__text', '__hover', '__job', '__placed',
+                 '__bindings', '__weakref__')
+
+    def __init__(self, widget: tk.Widget, text: (str, Callable), triggerkey: str='<Enter>', releasekey: str='<Leave>', bg: str='white', delayed: bool=True, delaytime: int=1000, fg: str='black', fadeout: str='enabled', fadein: str='enabled', shadowed: bool=True, shadowcolor: str='black', outlinecolor: str='black', side: str='right', onpress: bool=True, lazy: bool=True, still: bool=False, fadetime: int=200, render: str='polygon', shadowsteps: int=3, loadingtext: str='...', textttl: int=30000, live: bool=False):
         
         # Widget properties
         self.widget          = widget
@@ -43,12 +617,18 @@ class RoundedToolTip:
         self.delaytime       = delaytime
         self.shadowed        = shadowed
         self.outlinecolor    = outlinecolor
+        self.lazy            = lazy
+        self.still           = still
+        self.fadetime        = fadetime
+        self.render          = render
+        self.shadowsteps     = shadowsteps
+        self.loadingtext     = loadingtext
+        self.textttl         = textttl
+        self.live            = live
         if self.shadowed:
             self.shadowcolor = shadowcolor
 
         # Widget attributes
-        self.__time          = 0
-        self.__once          = False
         self.__hidden        = True
         args                 = dict(locals())
         del args['self']
@@ -56,112 +636,141 @@ class RoundedToolTip:
         # Perform type check on the inserted values
         self.__type_check(args)
 
-        # Making the window
-        self.__master = tk.Toplevel()
-        self.__master.attributes('-alpha', 0)  # Hide the window
-        self.__master.overrideredirect(1)
-        self.__master.attributes('-topmost', True)
-        self.__master.attributes('-transparentcolor', '#f0f0f0')  # Green key
-        
-        self.__frame = tk.Frame(self.__master)
-        self.__frame.pack(expand=1)
+        # Size of the text is cached once measured, the window itself is lent by the pool on show
+        self.__window        = None
+        self.__size          = None
+        self.__text          = text if isinstance(text, str) else loadingtext  # Text shown, providers are resolved on hover
+        self.__hover         = 0  # Counts hovers, to drop the texts resolved for a previous one
+        self.__box           = None  # Size of the box drawn on the window
+        self.__job           = None  # Pending live redraw
+        self.__placed        = side  # Side the tooltip went on last
+        self._anchor         = None  # Callable giving the root x, y, width and height of a region of the widget to annotate
+        if not self.lazy:
+            self.__measure()
 
-        # Dummy widget to get size of text
-        self.__label = tk.Label(self.__frame, text=self.text)
-        self.__label.grid(row=0, column=0,ipadx=5,ipady=5)
-        self.__master.update()
-        h,w = self.__label.winfo_height(),self.__label.winfo_width()
-        self.__label.grid_remove()
+        # Widget events come through the router of the application, kept to be removed on teardown
+        self.__bindings      = []
+        if self.onpress:
+            self.__bind('<ButtonPress>', self.__remove)
+            self.__bind('<Key>', self.__remove)
+        self.__bind(triggerkey, self.__start_timer)
+        self.__bind(releasekey, self.__re_timer)
+        if self.delayed and self.still:
+            self.__bind('<Motion>', self.__moved)
+        self.__bind('<Destroy>', self.destroy)
+        _live.add(self)
 
-        # Canvas for rounded box
-        self.__canvas = tk.Canvas(self.__frame)
-        self.__canvas.grid(row=0,column=0)
+    def __bind(self, sequence, func):
+        EventRouter.of(self.widget).register(self.widget, sequence, func)
+        self.__bindings.append((sequence, func))
 
-        # Multiple rectangles for shadows
-        if self.shadowed:
-            for i in range(3):
-                self.__round_rectangle(5,5,w+i,h+i, radius=25, fill=self.shadowcolor,tag=f'shadow{i}') # Add shadow color
-        # Main rounded rectangle
-        self.__round_rectangle(5,5,w,h, radius=25, fill=self.bg ,outline=self.outlinecolor,tag='frame')
+    def destroy(self, e=None):
+        """Function to tear down the tooltip and its bindings, called on its own when the widget is destroyed"""
+        if e is not None and e.widget is not self.widget:  # Destroy of a child of the widget
+            return
+        HoverScheduler.of(self.widget).cancel(self)
+        TextResolver.of(self.widget).forget(self)
+        self.__hover += 1
+        try:
+            if self.__job is not None:
+                self.widget.after_cancel(self.__job)
+                self.__job = None
+            self.clear()
+        except tk.TclError:  # The application is going away
+            pass
+        router = EventRouter.of(self.widget)
+        for sequence,func in self.__bindings:
+            router.unregister(self.widget, sequence, func)
+        ToolTipPool.of(self.widget).forget(self)
+        self.__window = None
+        self.__bindings = []
+        _live.discard(self)
+
+    def __measure(self):
+        """Function to get the size of the text, measured only once"""
+        if self.__size is None:
+            w,h = measure_text(self.widget, self.__text)
+            if self.live:  # Rounded up, the box keeps its size while the text changes a little
+                w = -(-w//_LIVE_STEP)*_LIVE_STEP
+            self.__size = w,h
+        return self.__size
+
+    @instruments.handler('skin')
+    def _skin(self, window):
+        """Function to draw the tooltip on a pooled window"""
+        self.__window = window
+        w,h = self.__box = self.__measure()
+
+        window.label.grid_remove()
+        window.frame.config(bg=window.background, highlightthickness=0)
+        canvas = window.canvas
+        canvas.delete('all')
+        canvas.grid(row=0,column=0)
+
+        if self.render.lower() == 'polygon':
+            # Multiple rectangles for shadows
+            if self.shadowed:
+                for i in range(self.shadowsteps):
+                    self.__round_rectangle(canvas,5,5,w+i,h+i, radius=25, fill=self.shadowcolor,tag=f'shadow{i}') # Add shadow color
+            # Main rounded rectangle
+            self.__round_rectangle(canvas,5,5,w,h, radius=25, fill=self.bg ,outline=self.outlinecolor,tag='frame')
+
+        elif self.render.lower() == 'image':
+            # Box and shadow pre-rendered once for this size and colors
+            shadow = self.shadowcolor if self.shadowed else None
+            image = BoxImageCache.of(self.widget).get(w,h,25,self.bg,self.outlinecolor,shadow,self.shadowsteps,window.background)
+            canvas.create_image(0,0,anchor='nw',image=image,tag='frame')
+
+        else:
+            raise tk.TclError(f"Unknown value '{self.render}' for option -render. Must be 'polygon' or 'image'")
         # Text for the widget
-        self.__canvas.create_text((5+w)/2,(5+h)/2,text=text, fill=self.fg, tag='text')
+        canvas.create_text((5+w)/2,(5+h)/2,text=self.__text, fill=self.fg, tag='text')
 
-        # Widget bindings
-        if self.onpress:
-            self.widget.bind('<ButtonPress>', self.__remove)
-            self.widget.bind('<Key>', self.__remove)
-        self.widget.bind(triggerkey, self.__start_timer)
-        self.widget.bind(releasekey, self.__re_timer)
-            
+    def _evict(self):
+        """Function called when the pooled window is taken over by another tooltip"""
+        Animator.of(self.widget).cancel(self.__window)
+        self.__window = None
+        self.__hidden = True
+
+    def __target(self, event):
+        """Function to get the root x, y, width and height of what the tooltip annotates"""
+        if self._anchor is not None:  # A region inside the widget
+            return self._anchor()
+        return Placer.of(self.widget).rect(event.widget)
+
+    @instruments.handler('show')
     def __add(self, event):
         """Function to fade and show tooltip"""
 
         def show():
             """Function to add the tooltip on the calculated dimensions"""
-            if self.side.lower() == 'right':
-                # Window size
-                w = self.__label.winfo_width() + 10
-                h = self.__label.winfo_height() + 10
-
-                # Offset size
-                offset_x = event.widget.winfo_width()
-                offset_y = 2
-                self.x = event.widget.winfo_rootx() + offset_x
-                self.y = event.widget.winfo_rooty() + offset_y
-
-                # Apply geometry
-                self.__master.geometry(f'{w}x{h}+{self.x}+{self.y}')
-
-                # Bringing the visibility of the window back
-                # self.__master.attributes('-alpha', 1)
-                # self.__hidden = False  # Setting status to false
-            
-            elif self.side.lower() == 'left':
-                # Window size
-                w = self.__label.winfo_width() + 10
-                h = self.__label.winfo_height() + 10
-
-                # Offset size
-                offset_x = 5
-                offset_y = 5
-                self.x = event.widget.winfo_rootx() - w
-                self.y = event.widget.winfo_rooty() + offset_y
-
-                # Apply geometry
-                self.__master.geometry(f'{w}x{h}+{self.x}+{self.y}')
-
-                # Bringing the visibility of the window back
-                # self.__master.attributes('-alpha', 1)
-                # self.__hidden = False  # Setting status to false
-            
-            else:
-                raise tk.TclError(f"Unknown value '{self.side}' for option -side. Must be right or left")        
-        
-        x,y = self.__master.winfo_pointerx(),self.__master.winfo_pointery()
-        wid = self.__master.winfo_containing(x,y)        
-        if wid == self.widget:
+            self.__window = ToolTipPool.of(self.widget).acquire(self)
+            if self.live:  # Texts set while hidden were not drawn
+                self.__redraw()
+
+            # Window size, placed next to the target from the cached geometry
+            w,h = self.__measure()
+            w,h = w + 10,h + 10
+            self.x,self.y,self.__placed = Placer.of(self.widget).place(self.__target(event), (w,h), self.side)
+
+            # Apply geometry
+            self.__window.master.geometry(f'{w}x{h}+{self.x}+{self.y}')
+
+        if EventRouter.of(self.widget).suppressed:  # Started to drag or scroll during the delay
+            return
+        placer = Placer.of(self.widget)
+        if placer.contains(self.widget, *placer.pointer()):
 
             if self.__hidden:
                 show()
+                self.__hidden = False
+            animator = Animator.of(self.widget)
             
-            if self.fadein.lower() == 'enabled':  # If fadeout enabled
-                # print(self.__master.attributes('-alpha'))
-                if self.__hidden:  # If window is hidden
-                    alpha = self.__master.attributes('-alpha')
-                    if alpha < 1:
-                        alpha += 0.10
-                        self.__master.attributes('-alpha', alpha)
-                        self.__master.after(20, self.__add, event)
-                    else:
-                        self.__hidden = False
-
-                else:
-                    self.__master.attributes('-alpha', 1)  # show the window
-
-            elif self.fadein.lower() == 'disabled':  # If fadeout disabled
-                if self.__hidden:
-                    self.__master.attributes('-alpha', 1)
-                    self.__hidden = False
+            if self.fadein.lower() == 'enabled':  # If fadein enabled
+                animator.fade(self.__window, 1, self.fadetime)  # Supersedes a running fadeout
+
+            elif self.fadein.lower() == 'disabled':  # If fadein disabled
+                animator.fade(self.__window, 1, 0)
 
             else:
                 raise tk.TclError(f"Unknown value '{self.fadein}' option -fadeout. Must be 'enabled' or 'disabled'")
@@ -169,61 +778,82 @@ class RoundedToolTip:
         else:
             self.clear()
 
+    @instruments.handler('hide')
     def __remove(self, *args):
         """Function to remove tooltip with/without fade effect"""
 
+        if self.__window is None:  # Nothing shown
+            return
+
         if self.fadeout.lower() == 'enabled':  # If fadeout enabled
+            animator = Animator.of(self.widget)
             if not self.__hidden:  # If window is not hidden
-                alpha = self.__master.attributes('-alpha')
-                if alpha > 0:
-                    alpha -= 0.10
-                    self.__master.attributes('-alpha', alpha)
-                    self.__master.after(20, self.__remove)
-                    # print('remove')
-                else:
-                    self.__hidden = True
-
-            else:
-                self.__master.attributes('-alpha', 0)  # Hide the window
+                self.__hidden = True  # Being hidden, a new trigger shows it again
+                animator.fade(self.__window, 0, self.fadetime, self.clear)  # Supersedes a running fadein
+            elif not animator.running(self.__window):
+                self.clear()  # Hide the window
 
         elif self.fadeout.lower() == 'disabled':  # If fadeout disabled
-            if not self.__hidden:
-                self.__master.attributes('-alpha', 0)
-                self.__hidden = True
+            self.clear()
 
         else:
             raise tk.TclError(f"Unknown value '{self.fadeout}' option -fadeout. Must be 'enabled' or 'disabled'")
 
+    @instruments.handler('clear')
     def clear(self):
-        """Function to destroy the tooltip window"""
-        self.__master.attributes('-alpha',0)
+        """Function to hide the tooltip and give back its window to the pool"""
+        if self.__window is not None:
+            Animator.of(self.widget).cancel(self.__window)
+            self.__window.set_alpha(0)
+            ToolTipPool.of(self.widget).release(self)
         self.__hidden = True
     
+    @instruments.handler('enter')
     def __start_timer(self,e):
         """Function to start the wait timer"""
+        if EventRouter.of(self.widget).suppressed:  # Dragging or scrolling
+            return
+        self.__hover += 1
+        self.__resolve()
         if self.delayed:
-            self.__time += 1
-
-            if self.__time >= self.delaytime and self.__hidden and not self.__once:           
-                self.__add(e)
-                self.__once = True
-        
-            self.rep = self.widget.after(1,self.__start_timer,e)
+            if self.__hidden:
+                HoverScheduler.of(self.widget).arm(self,self.delaytime,self.__add,e,still=self.still)
         else:
             self.__add(e)
 
+    @instruments.handler('leave')
     def __re_timer(self,e=None):
         """Function to restart the timer"""
+        self.__hover += 1  # Texts still being resolved are not shown
         if self.delayed:
-            self.__time = 0
-            self.widget.after_cancel(self.rep)
-            self.__remove()
-            self.__once = False
-        
-        else:
-            self.__remove()
+            HoverScheduler.of(self.widget).cancel(self)
+        self.__remove()
+
+    def __resolve(self):
+        """Function to start resolving a text provider, its cached text is used while fresh"""
+        if not callable(self.text):
+            return
+        resolver = TextResolver.of(self.widget)
+        text = resolver.cached(self)
+        if text is not None:
+            self.__set_text(text)
+            return
 
-    def __round_rectangle(self, x1, y1, x2, y2, radius=25, **kwargs):
+        hover = self.__hover
+        self.__set_text(self.loadingtext)
+        resolver.resolve(self, self.text, self.textttl, lambda text: self.__resolved(text, hover))
+
+    def __resolved(self, text, hover):
+        """Function to show a resolved text, if the pointer did not leave since"""
+        if hover == self.__hover:
+            self.__set_text(text)
+
+    @instruments.handler('motion')
+    def __moved(self,e):
+        """Function to restart the wait of a still hover"""
+        HoverScheduler.of(self.widget).moved(self)
+
+    def __round_rectangle(self, canvas, x1, y1, x2, y2, radius=25, **kwargs):
         """To create rounded rectangle, taken from the SO answer"""
         # https://stackoverflow.com/q/44099594/13382000
         points = [x1+radius, y1,
@@ -247,9 +877,9 @@ class RoundedToolTip:
               x1, y1+radius,
               x1, y1]
         
-        return self.__canvas.create_polygon(points, **kwargs, smooth=True)
+        return canvas.create_polygon(points, **kwargs, smooth=True)
 
-    def __update_rectangle_coords(self, round_rect, x1, y1, x2, y2, radius=25):
+    def __update_rectangle_coords(self, canvas, round_rect, x1, y1, x2, y2, radius=25):
         """Function to update the given rounded rectange"""
         points = (x1+radius, y1,
             x1+radius, y1,
@@ -271,7 +901,7 @@ class RoundedToolTip:
             x1, y1+radius,
             x1, y1+radius,
             x1, y1)
-        self.__canvas.coords(round_rect, *points)
+        canvas.coords(round_rect, *points)
 
     def __type_check(self,args):
         """Function for type inspection on runtime"""
@@ -279,21 +909,63 @@ class RoundedToolTip:
             if not isinstance(v,k[1]):
                 raise TypeError(f"Invalid type '{type(v)}' for property -{k[0]}, valid type is '{k[1]}'")
 
+    @instruments.handler('config_text')
     def config_text(self,text):
-        """Function to update the text of tooltip"""
+        """Function to update the text of tooltip, a callable or coroutine function is resolved on the next hover"""
 
-        self.__label.config(text=text)
-        self.__label.grid(row=0,column=0,ipadx=5,ipady=5)
-        self.__master.update()
-        h,w = self.__label.winfo_height(),self.__label.winfo_width()
-        self.__label.grid_forget()
-        
-        self.__update_rectangle_coords('frame',5,5,w,h)
-        self.__canvas.coords('text',(5+w)/2,(5+h)/2)
-        self.__canvas.itemconfig('text',text=text)
-        if self.shadowed:
-            for i in range(3):
-                self.__update_rectangle_coords(f'shadow{i}',5,5,w+i,h+i)
+        self.text = text
+        if callable(text):
+            TextResolver.of(self.widget).forget(self)
+            return
+        self.__set_text(text)
+
+    def __set_text(self,text):
+        """Function to change the text shown"""
+        self.__text = text
+        self.__size = None
+        if not self.live:
+            self.__redraw()
+
+        # Live, only the latest text is drawn on the next frame, and nothing while hidden
+        elif self.__job is None and self.__window is not None and not self.__hidden:
+            self.__job = self.widget.after(16, self.__flush)
+
+    def __flush(self):
+        """Function to draw the latest live text"""
+        self.__job = None
+        self.__redraw()
+
+    @instruments.handler('redraw')
+    def __redraw(self):
+        """Function to draw the text on the window, the box is relaid out only if its size changed"""
+
+        # Only if the pooled window is still skinned with this tooltip
+        if self.__window is None:
+            return
+        w,h = self.__measure()
+        canvas = self.__window.canvas
+        if (w,h) == self.__box:
+            canvas.itemconfig('text',text=self.__text)
+            return
+        old,self.__box = self.__box,(w,h)
+
+        if self.render.lower() == 'image':  # A single image, swapped for the one of the new size
+            self._skin(self.__window)
+        else:
+            self.__update_rectangle_coords(canvas,'frame',5,5,w,h)
+            canvas.coords('text',(5+w)/2,(5+h)/2)
+            canvas.itemconfig('text',text=self.__text)
+            if self.shadowed:
+                for i in range(self.shadowsteps):
+                    self.__update_rectangle_coords(canvas,f'shadow{i}',5,5,w+i,h+i)
+
+        # Keep the shown window fitting the box
+        if not self.__hidden:
+            if self.__placed == 'left':
+                self.x -= w - old[0]
+            elif self.__placed == 'top':
+                self.y -= h - old[1]
+            self.__window.master.geometry(f'{w+10}x{h+10}+{self.x}+{self.y}')
 
 class ToolTip():
     '''
@@ -304,10 +976,18 @@ class ToolTip():
     bg - Background color of tooltip window(default-yellow-ish), accepts hex and standard colors\n
     fg - Foreground color/Font color of the text, accepts hex and standard colors\n
     fadeout - Default set to 'enabled', set to 'disabled' to disable fadeout of tooltip\n
-    ISSUE: What if user want it on left side?
+    fadetime - Time taken by the fadeout in ms(default-200)\n
+    side - 'right'(default), 'left', 'top' or 'bottom', flipped to the opposite side when it does not fit on the screen\n
+    text can also be a callable or coroutine function, resolved off the Tk thread when the tooltip shows\n
+    loadingtext - Text shown while it resolves(default-'...')\n
+    textttl - Time a resolved text is cached for in ms(default-30000)\n
+    The tooltip tears itself down when the widget is destroyed, or with destroy\n
     '''
+    __slots__ = ('widget', 'text', 'bg', 'side', 'fg', 'fadeout', 'fadetime', 'master', 'frame', 'label', 'hidden', 'x', 'y',
+                 'loadingtext', 'textttl', '__window', '__hover', '__placed', '__written', '__bindings', '__weakref__')
 
-    def __init__(self, widget, text, triggerkey='<Enter>', releasekey='<Leave>', bg='#ffffe0', fg='black', side='right', fadeout='enabled'):
+    def __init__(self, widget, text, triggerkey='<Enter>', releasekey='<Leave>', bg='#ffffe0', fg='black', side='right', fadeout='enabled', fadetime=200,
+                 loadingtext='...', textttl=30000):
         # basic widget attributes
         self.widget = widget
         self.text = text
@@ -315,91 +995,362 @@ class ToolTip():
         self.side = side
         self.fg = fg
         self.fadeout = fadeout
+        self.fadetime = fadetime
+        self.loadingtext = loadingtext
+        self.textttl = textttl
+        self.__hover = 0  # counts shows, to drop the texts resolved for a previous one
+        self.__placed = side  # side the tooltip went on last
+        self.__written = None  # text on the label
 
-        # making the tooltip
-        self.master = tk.Toplevel()
-        self.master.attributes('-alpha', 0)  # hide the window
-        self.master.attributes('-transparentcolor', '#f0f0f0')  # hide the window
-        self.master.overrideredirect(1)
-        self.master.attributes('-topmost', True)
-        self.frame = tk.Frame(self.master, bg=self.bg, highlightbackground="black",
-                              highlightcolor="black", highlightthickness=1)
-        self.frame.pack(expand=1, fill='x')
-        self.label = tk.Label(self.frame, text=self.text,
-                              bg=self.bg, justify=tk.LEFT, fg=self.fg)
-        self.label.grid(row=0, column=0)
+        # the tooltip window is lent by the pool on show
+        self.master = None
+        self.frame = None
+        self.label = None
+        self.__window = None
 
-        # widget binding
-        self.widget.bind(triggerkey, self.add)
-        self.widget.bind(releasekey, self.remove)
-        self.widget.bind('<ButtonPress>', self.remove)
+        # widget events through the router of the application, kept to be removed on teardown
+        self.__bindings = [(triggerkey, self.add), (releasekey, self.remove), ('<ButtonPress>', self.remove), ('<Destroy>', self.destroy)]
+        router = EventRouter.of(self.widget)
+        for sequence,func in self.__bindings:
+            router.register(self.widget, sequence, func)
+        _live.add(self)
 
         # reference to window status
         self.hidden = True
 
-    def add(self, event):
-        if self.side.lower() == 'right':
-            # Window size
-            w = self.label.winfo_width() + 10
-            h = self.label.winfo_height() + 10
+    def destroy(self, e=None):
+        """Function to tear down the tooltip and its bindings, called on its own when the widget is destroyed"""
+        if e is not None and e.widget is not self.widget:  # destroy of a child of the widget
+            return
+        try:
+            self.clear()
+        except tk.TclError:  # the application is going away
+            pass
+        router = EventRouter.of(self.widget)
+        for sequence,func in self.__bindings:
+            router.unregister(self.widget, sequence, func)
+        ToolTipPool.of(self.widget).forget(self)
+        TextResolver.of(self.widget).forget(self)
+        self.__hover += 1
+        self.__window = self.master = self.frame = self.label = None
+        self.__bindings = []
+        _live.discard(self)
 
-            # Offset size
-            offset_x = event.widget.winfo_width()
-            offset_y = 2
-            self.x = event.widget.winfo_rootx() + offset_x
-            self.y = event.widget.winfo_rooty() + offset_y
+    @instruments.handler('skin')
+    def _skin(self, window):
+        """Function to draw the tooltip on a pooled window"""
+        self.__window = window
+        self.master = window.master
+        self.frame = window.frame
+        self.label = window.label
 
-            # Apply geometry
-            self.master.geometry(f'{w}x{h}+{self.x}+{self.y}')
+        window.canvas.grid_remove()
+        self.frame.config(bg=self.bg, highlightbackground="black",
+                          highlightcolor="black", highlightthickness=1)
+        self.__written = self.__shown()
+        self.label.config(text=self.__written, bg=self.bg, fg=self.fg)
+        self.label.grid(row=0, column=0)
 
-            # Bringing the visibility of the window back
-            self.master.attributes('-alpha', 1)
-            self.hidden = False  # Setting status to false
-        
-        elif self.side.lower() == 'left':
-            # Window size
-            w = self.label.winfo_width() + 10
-            h = self.label.winfo_height() + 10
+    def __shown(self):
+        """Function to get the text to show, the cached one of a text provider or the loading text"""
+        if not callable(self.text):
+            return self.text
+        text = TextResolver.of(self.widget).cached(self)
+        return self.loadingtext if text is None else text
 
-            # Offset size
-            offset_x = 5
-            offset_y = 5
-            self.x = event.widget.winfo_rootx() - w
-            self.y = event.widget.winfo_rooty() + offset_y
+    def __resolved(self, text, hover):
+        """Function to show a resolved text, if the tooltip was not hidden since"""
+        if hover != self.__hover or self.master is None:
+            return
+        w,h = measure_text(self.widget, text)
+        lw,lh = measure_text(self.widget, self.loadingtext)
+        if self.__placed == 'left':
+            self.x += lw - w
+        elif self.__placed == 'top':
+            self.y += lh - h
+        self.__written = text
+        self.label.config(text=text)
+        self.master.geometry(f'{w}x{h}+{self.x}+{self.y}')
 
-            # Apply geometry
-            self.master.geometry(f'{w}x{h}+{self.x}+{self.y}')
+    def _evict(self):
+        """Function called when the pooled window is taken over by another tooltip"""
+        Animator.of(self.widget).cancel(self.__window)
+        self.__window = self.master = self.frame = self.label = None
+        self.hidden = True
 
-            # Bringing the visibility of the window back
-            self.master.attributes('-alpha', 1)
-            self.hidden = False  # Setting status to false
-        
-        else:
-            raise tk.TclError(f"Unknown value '{self.side}' for option -side. Must be right or left")
+    @instruments.handler('show')
+    def add(self, event):
+        if EventRouter.of(self.widget).suppressed:  # dragging or scrolling
+            return
+        ToolTipPool.of(self.widget).acquire(self)
+        self.__hover += 1
+        text = self.__shown()
+        if callable(self.text) and text is self.loadingtext:
+            hover = self.__hover
+            TextResolver.of(self.widget).resolve(self, self.text, self.textttl, lambda text: self.__resolved(text, hover))
+        if text != self.__written:  # resolved while hidden, or changed since the window was skinned
+            self.__written = text
+            self.label.config(text=text)
+
+        # Window size, placed next to the widget from the cached geometry
+        w,h = measure_text(self.widget, text)
+        placer = Placer.of(self.widget)
+        self.x,self.y,self.__placed = placer.place(placer.rect(event.widget), (w,h), self.side)
 
+        # Apply geometry
+        self.master.geometry(f'{w}x{h}+{self.x}+{self.y}')
+
+        # Bringing the visibility of the window back, stopping a running fadeout
+        Animator.of(self.widget).fade(self.__window, 1, 0)
+        self.hidden = False  # Setting status to false
+
+    @instruments.handler('hide')
     def remove(self, *args):
+        self.__hover += 1  # texts still being resolved are not shown
+        if self.master is None:  # nothing shown
+            return
+
         if self.fadeout.lower() == 'enabled':  # If fadeout enabled
 
             if not self.hidden:  # If window is not hidden
-                alpha = self.master.attributes('-alpha')
-                if alpha > 0:
-                    alpha -= 0.10
-                    self.master.attributes('-alpha', alpha)
-                    self.master.after(20, self.remove)
+                Animator.of(self.widget).fade(self.__window, 0, self.fadetime, self.clear)
 
             else:
-                self.master.attributes('-alpha', 0)  # Hide the window
+                self.clear()  # Hide the window
 
         elif self.fadeout.lower() == 'disabled':  # If fadeout disabled
-            if not self.hidden:
-                self.master.attributes('-alpha', 0)
-                self.hidden = True
+            self.clear()
 
         else:
             raise tk.TclError(f"Unknown value '{self.fadeout}' option -fadeout. Must be 'enabled' or 'disabled'")
 
+    @instruments.handler('clear')
     def clear(self):
-        self.master.destroy()
+        """Function to hide the tooltip and give back its window to the pool, the window is shared so it is not destroyed"""
+        if self.master is not None:
+            Animator.of(self.widget).cancel(self.__window)
+            self.__window.set_alpha(0)
+            ToolTipPool.of(self.widget).release(self)
+        self.hidden = True
+
+class GridIndex:
+    """Uniform grid over bounding boxes, the boxes under a point are found by looking at one cell only
+
+    Keyword Arguments:
+        cell -- Size of a grid cell(default-64), works best around the size of the indexed boxes
+    """
+    def __init__(self, cell: int=64):
+        self.cell = cell
+        self.__cells = collections.defaultdict(dict)  # (column, row): {key: bbox}
+        self.__boxes = {}  # key: (bbox, order)
+        self.__order = itertools.count()
+
+    def __len__(self):
+        return len(self.__boxes)
+
+    def __contains__(self, key):
+        return key in self.__boxes
+
+    def __span(self, bbox):
+        """Function to get the cells covered by the bbox"""
+        x1,y1,x2,y2 = bbox
+        cell = self.cell
+        return [(c, r) for c in range(int(x1//cell), int(x2//cell) + 1)
+                       for r in range(int(y1//cell), int(y2//cell) + 1)]
+
+    def insert(self, key, bbox):
+        """Function to add the box x1,y1,x2,y2 under key, or move it if key is already indexed"""
+        order = self.__boxes[key][1] if key in self.__boxes else next(self.__order)
+        self.remove(key)
+        self.__boxes[key] = (tuple(bbox), order)
+        for cell in self.__span(bbox):
+            self.__cells[cell][key] = order
+
+    move = insert
+
+    def remove(self, key):
+        """Function to drop the box of key, if indexed"""
+        entry = self.__boxes.pop(key, None)
+        if entry is None:
+            return
+        for cell in self.__span(entry[0]):
+            keys = self.__cells[cell]
+            keys.pop(key, None)
+            if not keys:
+                del self.__cells[cell]
+
+    def bbox(self, key):
+        """Function to get the indexed box of key"""
+        return self.__boxes[key][0]
+
+    def query(self, x, y):
+        """Function to get the key of the box under x,y(the last indexed one when they overlap), None if there is none"""
+        found,top = None,-1
+        keys = self.__cells.get((int(x//self.cell), int(y//self.cell)), ())
+        for key in keys:
+            x1,y1,x2,y2 = self.__boxes[key][0]
+            if x1 <= x <= x2 and y1 <= y <= y2 and keys[key] > top:
+                found,top = key,keys[key]
+        return found
+
+class _RegionToolTip(abc.ABC):
+    """Base of the virtual tooltips showing a text per region of a single widget through one RoundedToolTip"""
+
+    def __init__(self, widget, text, **kwargs):
+        self.widget = widget
+        self.text = text  # Fallback for regions without a text of their own, str or callable(region)
+        self.__texts = {}  # region: str or callable(region)
+        self.__region = None
+
+        # Regions are entered and left through virtual events on the widget
+        self.tooltip = RoundedToolTip(widget, '', triggerkey='<<RegionEnter>>', releasekey='<<RegionLeave>>', **kwargs)
+        self.tooltip._anchor = self.__anchor
+        router = EventRouter.of(widget)
+        router.register(widget, '<Motion>', self.__motion)
+        router.register(widget, '<Leave>', self.__leave)
+
+    @property
+    def region(self):
+        """The hovered region, None if the pointer is over none"""
+        return self.__region
+
+    def _set_text(self, region, text):
+        if text is None:
+            self.__texts.pop(region, None)
+        else:
+            self.__texts[region] = text
+
+    @abc.abstractmethod
+    def _resolve(self, event):
+        """Function to find the region under the pointer"""
+
+    @abc.abstractmethod
+    def _rect(self, region):
+        """Function to get the root x, y, width and height of the region"""
+
+    def __anchor(self):
+        return self._rect(self.__region)
+
+    def __text(self, region):
+        text = self.__texts.get(region, self.text)
+        return str(text(region) if callable(text) else text)
+
+    @instruments.handler('motion')
+    def __motion(self, e):
+        """Function to move the tooltip to the region under the pointer"""
+        region = self._resolve(e)
+        if region == self.__region:
+            return
+        self.__region = region
+        if region is None:
+            self.widget.event_generate('<<RegionLeave>>')  # Fades out
+        else:
+            self.tooltip.clear()  # Swapped at once between regions
+            self.tooltip.config_text(self.__text(region))
+            self.widget.event_generate('<<RegionEnter>>')
+
+    def __leave(self, e):
+        """Function to hide the tooltip when the pointer leaves the widget"""
+        if self.__region is not None:
+            self.__region = None
+            self.widget.event_generate('<<RegionLeave>>')
+
+class CanvasToolTip(_RegionToolTip):
+    """Tooltips for any number of canvas items through a single host, the hovered item is found with a GridIndex
+    specify the canvas as positional argument, texts are given per item with add
+
+    Keyword Arguments:
+        text -- Text of the items added without one, str or callable(item)
+
+        cell -- Size of the index cells in canvas units(default-64)
+
+        Any other keyword argument is passed on to the RoundedToolTip showing the texts
+    """
+    def __init__(self, canvas: tk.Canvas, text='', cell: int=64, **kwargs):
+        super().__init__(canvas, text, **kwargs)
+        self.index = GridIndex(cell)
+
+    def add(self, item, text=None, bbox=None):
+        """Function to give a text(str or callable(item)) to the item, bbox is read from the canvas if not given"""
+        self._set_text(item, text)
+        self.index.insert(item, bbox or self.widget.bbox(item))
+
+    def move(self, item, bbox=None):
+        """Function to update the index after the item was moved or resized"""
+        self.index.move(item, bbox or self.widget.bbox(item))
+
+    def remove(self, item):
+        """Function to drop the item, for example once it is deleted from the canvas"""
+        self._set_text(item, None)
+        self.index.remove(item)
+
+    def _resolve(self, event):
+        return self.index.query(self.widget.canvasx(event.x), self.widget.canvasy(event.y))
+
+    def _rect(self, item):
+        x1,y1,x2,y2 = self.index.bbox(item)
+        rootx,rooty,_,_ = Placer.of(self.widget).rect(self.widget)
+        x = rootx + x1 - self.widget.canvasx(0)
+        y = rooty + y1 - self.widget.canvasy(0)
+        return int(x),int(y),int(x2 - x1),int(y2 - y1)
+
+class TreeviewToolTip(_RegionToolTip):
+    """Tooltips for the rows of a treeview through a single host, specify the treeview as positional argument
+
+    The span of the hovered row is kept, so motion inside it does not ask the treeview again
+
+    Keyword Arguments:
+        text -- Text of the rows without one, str or callable(iid)
+
+        Any other keyword argument is passed on to the RoundedToolTip showing the texts
+    """
+    def __init__(self, tree: tk.Widget, text='', **kwargs):
+        super().__init__(tree, text, **kwargs)
+        self.__row = None  # (iid, top, bottom) of the last resolved row
+
+        # Rows move under the pointer on scroll, resize, open and close
+        for sequence in ('<Configure>', '<MouseWheel>', '<Button-4>', '<Button-5>', '<<TreeviewOpen>>', '<<TreeviewClose>>'):
+            EventRouter.of(tree).register(tree, sequence, self.invalidate)
+
+    def add(self, iid, text):
+        """Function to give a text(str or callable(iid)) to the row"""
+        self._set_text(iid, text)
+
+    def remove(self, iid):
+        """Function to drop the text of the row"""
+        self._set_text(iid, None)
+
+    def invalidate(self, *args):
+        """Function to forget the span of the hovered row, after the rows moved"""
+        self.__row = None
+
+    def _resolve(self, event):
+        if self.__row is not None and self.__row[1] <= event.y < self.__row[2]:
+            return self.__row[0]
+
+        iid = self.widget.identify_row(event.y)
+        if not iid:
+            self.__row = None
+            return None
+        bbox = self.widget.bbox(iid)
+        if bbox:
+            self.__row = (iid, bbox[1], bbox[1] + bbox[3])
+        return iid
+
+    def _rect(self, iid):
+        rootx,rooty,width,_ = Placer.of(self.widget).rect(self.widget)
+        x,y,w,h = self.widget.bbox(iid) or (0, 0, width, 0)
+        return rootx + x,rooty + y,w,h
+
+def attach_many(mapping, kind=None, **kwargs):
+    """Function to attach tooltips to many widgets at once, takes a mapping of widget to text,
+    other keyword arguments are passed on to every tooltip
+
+    Keyword Arguments:
+        kind -- Tooltip class to attach(default-RoundedToolTip)
+    """
+    kind = kind or RoundedToolTip
+    return {widget: kind(widget, text, **kwargs) for widget, text in mapping.items()}
 
 if __name__ == '__main__':
     root = tk.Tk()
@@ -413,4 +1364,4 @@ if __name__ == '__main__':
     ToolTip(b,text='Tooltip 1\nSimple Tooltip')
     RoundedToolTip(b1,text='Tooltip 2\nSimple Tooltip 2')
 
-    root.mainloop()
+    root.mainloop()
\ No newline at end of file
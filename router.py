@@ -0,0 +1,151 @@
+import tkinter as tk
+import contextlib
+
+from application import PerApplication
+
+# Bind tag carrying the class bindings of the router, added to the widgets registered with it
+TAG = 'MtkRouter'
+
+class EventRouter(PerApplication):
+    """Dispatcher of the events of every mtk widget of an application, each sequence is bound once on the
+    TAG class and handed to the handlers registered for the widget it happened on
+
+    The tag is put right after the widget's own tag, so bindings made by the application on the widget run
+    first, are never replaced, and can stop the mtk handlers by returning 'break'
+
+    Keyword Arguments:
+        dragging -- Default is True, suppresses tooltips while a mouse button is held and shortly after the
+                    wheel is scrolled, no new one shows and the shown ones hide unless made with onpress=False
+    """
+
+    def __init__(self, master: tk.Misc, dragging: bool=True):
+        super().__init__(master)
+        self.__handlers = {}  # Sequence: {widget path: [handler]}
+        self.__tagged = {}  # Widget path: number of handlers registered on it
+        self.__suppressed = 0
+        self.__listeners = []  # Called when the suppression starts
+        self.__wheel = None
+
+        # Everything registered on a widget is dropped once it is destroyed
+        self.__handlers['<Destroy>'] = {}
+        self.master.bind_class(TAG, '<Destroy>', self.__destroyed)
+
+        if dragging:  # Added to the application's bindings on all
+            self.master.bind_all('<ButtonPress>', self.__press, '+')
+            self.master.bind_all('<ButtonRelease>', self.__release, '+')
+            self.master.bind_all('<MouseWheel>', self.__scrolled, '+')
+
+    def register(self, widget, sequence, func):
+        """Function to call func with the event when sequence happens on widget, the sequence is bound only once"""
+        handlers = self.__handlers.get(sequence)
+        if handlers is None:
+            handlers = self.__handlers[sequence] = {}
+            self.master.bind_class(TAG, sequence, lambda e: self.__dispatch(handlers, e))
+
+        path = str(widget)
+        handlers.setdefault(path, []).append(func)
+        count = self.__tagged.get(path, 0)
+        if count == 0:
+            tags = widget.bindtags()
+            if TAG not in tags:
+                widget.bindtags(tags[:1] + (TAG,) + tags[1:])
+        self.__tagged[path] = count + 1
+
+    def unregister(self, widget, sequence, func):
+        """Function to stop calling func on sequence of widget"""
+        path = str(widget)
+        funcs = self.__handlers.get(sequence, {}).get(path)
+        if not funcs or func not in funcs:
+            return
+        funcs.remove(func)
+        if not funcs:
+            del self.__handlers[sequence][path]
+
+        self.__tagged[path] -= 1
+        if self.__tagged[path] == 0:  # Nothing left to route for the widget
+            del self.__tagged[path]
+            try:
+                widget.bindtags(tuple(tag for tag in widget.bindtags() if tag != TAG))
+            except tk.TclError:  # The widget is gone
+                pass
+
+    def __dispatch(self, handlers, event):
+        """Function to hand the event to the handlers of its widget"""
+        funcs = handlers.get(str(event.widget))
+        if not funcs:
+            return
+        result = None
+        for func in tuple(funcs):  # Handlers may unregister themselves
+            if func(event) == 'break':
+                result = 'break'
+        return result
+
+    def __destroyed(self, event):
+        """Function to hand <Destroy> to the handlers of the widget, then forget the widget"""
+        self.__dispatch(self.__handlers['<Destroy>'], event)
+        path = str(event.widget)
+        self.__tagged.pop(path, None)
+        for handlers in self.__handlers.values():
+            handlers.pop(path, None)
+
+    def __len__(self):
+        return len(self.__tagged)
+
+    @property
+    def suppressed(self):
+        """Whether tooltips are held back, during drags and scrolling"""
+        return self.__suppressed > 0
+
+    def on_suppress(self, func):
+        """Function to call func when the suppression starts, to hide what is shown"""
+        self.__listeners.append(func)
+
+    def suppress(self):
+        """Function to hold back tooltips until resume, calls can be nested"""
+        self.__suppressed += 1
+        if self.__suppressed == 1:
+            for func in self.__listeners:
+                func()
+
+    def resume(self):
+        """Function to undo a suppress"""
+        self.__suppressed = max(self.__suppressed - 1, 0)
+
+    @contextlib.contextmanager
+    def suppressing(self):
+        """Context manager holding back tooltips in its block"""
+        self.suppress()
+        try:
+            yield self
+        finally:
+            self.resume()
+
+    def __press(self, e):
+        if e.num in (4, 5):  # The wheel on x11
+            self.__scrolled(e)
+        else:
+            self.suppress()
+
+    def __release(self, e):
+        if e.num not in (4, 5):
+            self.resume()
+
+    def __scrolled(self, e):
+        """Function to hold back tooltips until the wheel has been still for 300ms"""
+        if self.__wheel is None:
+            self.suppress()
+        else:
+            self.master.after_cancel(self.__wheel)
+        self.__wheel = self.master.after(300, self.__wheel_stopped)
+
+    def __wheel_stopped(self):
+        self.__wheel = None
+        self.resume()
+
+if __name__ == '__main__':
+    root = tk.Tk()
+    label = tk.Label(root, text='HELLO')
+    label.pack()
+    label.bind('<Enter>', lambda e: print('application binding'))  # Left alone
+    EventRouter.of(root).register(label, '<Enter>', lambda e: print('routed'))
+    root.mainloop()